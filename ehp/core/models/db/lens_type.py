@@ -2,10 +2,13 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import DateTime, Integer, String, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ehp.core.models.db.base import BaseModel
 
+if TYPE_CHECKING:
+    from ehp.core.models.db.lens import Lens
+
 
 class LensType(BaseModel):
     __tablename__ = "lens_type"
@@ -23,7 +26,4 @@ class LensType(BaseModel):
         nullable=False,
     )
 
-    if TYPE_CHECKING:
-        from ehp.core.models.db.lens import Lens
-
-        lenses: Mapped[list[Lens]]
+    lenses: Mapped[list["Lens"]] = relationship(back_populates="lens_type")
@@ -71,6 +71,16 @@ class BaseRepository(Repository[T], Generic[T]):
             log_error(f"Error creating {self.model.__name__}: {e}")
             raise
 
+    async def bulk_create(self, entities: List[T]) -> List[T]:
+        """Add several entities and write them in a single flush."""
+        try:
+            self.session.add_all(entities)
+            await self.session.flush(entities)
+            return entities
+        except Exception as e:
+            log_error(f"Error bulk creating {self.model.__name__}: {e}")
+            raise
+
     async def update(self, entity: T) -> T:
         try:
             await self.session.flush()
@@ -11,9 +11,10 @@ import pytest
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from moto import mock_aws
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 from application import app as fastapi_app
 from ehp.base.aws import AWSClient
@@ -21,7 +22,7 @@ from ehp.base.jwt_helper import JWT_SECRET_NAME
 from ehp.config import settings
 from ehp.db.db_manager import DBManager
 from ehp.db.sqlalchemy_async_connector import Base
-from ehp.tests.utils.test_client import EHPTestClient
+from ehp.tests.utils.test_client import AsyncEHPTestClient, EHPTestClient
 
 
 # Override environment settings for testing when needed
@@ -48,13 +49,25 @@ def pytest_configure(config):
 # Create test database engine and tables
 @pytest.fixture(scope="session")
 async def test_engine():
-    # Use in-memory SQLite for testing
+    # Use in-memory SQLite for testing. StaticPool keeps a single connection open,
+    # so the database and its schema survive for the whole session.
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
-        poolclass=NullPool,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
         future=True,
     )
 
+    # Let SQLAlchemy emit BEGIN itself; the driver's implicit transactions do not
+    # support SAVEPOINT
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -67,19 +80,22 @@ async def test_engine():
 
 @pytest.fixture(scope="function")
 async def test_db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Get a test session that's rolled back after the test."""
+    """Get a test session that's rolled back after the test.
+    The session runs inside a SAVEPOINT of an outer transaction, so commits made
+    by the code under test only release the savepoint and the rollback undoes
+    everything."""
 
     async with test_engine.connect() as connection:
+        transaction = await connection.begin()
         asyncsession = sessionmaker(
             connection,
             expire_on_commit=False,
             class_=AsyncSession,
+            join_transaction_mode="create_savepoint",
         )
-        await connection.run_sync(Base.metadata.create_all)
         async with asyncsession() as session:
-            async with session.begin():
-                yield session
-                await session.rollback()
+            yield session
+        await transaction.rollback()
 
 
 @pytest.fixture
@@ -117,13 +133,39 @@ def app(test_db_manager) -> FastAPI:
     return fastapi_app
 
 
+@pytest.fixture(scope="session")
+def _session_test_client() -> Generator[EHPTestClient]:
+    """EHPTestClient shared by the whole test session.
+    The app is started once instead of once per test. Tests may override dependencies
+    but must not add or remove routes; ``test_client`` resets the rest between tests.
+    The patches are only active while a test uses ``test_client``."""
+    client = EHPTestClient(fastapi_app)
+    client._stop_patches()
+    with client.client:
+        yield client
+
+
 @pytest.fixture
 def test_client(
     app: FastAPI,
+    _session_test_client: EHPTestClient,
 ) -> Generator[EHPTestClient]:
     """Get a TestClient instance with mocked dependencies."""
-    client = EHPTestClient(app)
-    with client.client:
+    del app  # Used only to set up the test database
+    _session_test_client._start_patches()
+    _session_test_client.reset()
+    yield _session_test_client
+    _session_test_client.reset()
+    _session_test_client._stop_patches()
+
+
+@pytest.fixture
+async def async_test_client(
+    test_client: EHPTestClient,
+) -> AsyncGenerator[AsyncEHPTestClient, None]:
+    """Get an AsyncEHPTestClient that calls the app in-process over ASGI.
+    It shares the app and mocked dependencies of ``test_client``."""
+    async with AsyncEHPTestClient(test_client) as client:
         yield client
 
 
@@ -174,17 +216,29 @@ def sample_auth_params() -> Dict[str, str]:
     }
 
 
+@pytest.fixture(scope="session")
+def _session_aws_client() -> AWSClient:
+    """AWSClient whose boto3 clients are built once for the whole session.
+    Building a boto3 client loads the service model from disk, which dominated the setup
+    of every authenticated test. moto intercepts requests from clients created before
+    ``mock_aws`` starts, so the same clients can be reused inside each test's mock.
+    """
+    aws_client = AWSClient()
+    _ = aws_client.s3_client, aws_client.secretsmanager_client
+    return aws_client
+
+
 @pytest.fixture
-def aws_mock():
+def aws_mock(_session_aws_client: AWSClient):
     """
     Fixture to mock AWS services using moto.
     This can be used to mock S3, DynamoDB, etc. as needed.
+    Every test starts from an empty moto backend.
     """
     with mock_aws():
-        aws_client = AWSClient()
         # Create the S3 bucket that the application expects
-        aws_client.s3_client.create_bucket(Bucket=settings.AWS_S3_BUCKET)
-        yield aws_client
+        _session_aws_client.s3_client.create_bucket(Bucket=settings.AWS_S3_BUCKET)
+        yield _session_aws_client
 
 
 @pytest.fixture
@@ -1,19 +1,22 @@
+from collections.abc import Generator
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 import httpx
 import pytest
 
-from ehp.base.jwt_helper import TokenPayload
+from ehp.base.jwt_helper import JWTGenerator, TokenPayload
+from ehp.base.middleware import authorized_session
 from ehp.base.session import SessionManager
+from ehp.config import settings
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.user import User
-from ehp.core.repositories.authentication import AuthenticationRepository
-from ehp.core.repositories.user import UserRepository
+from ehp.core.repositories.wikiclip import WikiClipRepository
+from ehp.core.services.session import get_authentication
 from ehp.db.db_manager import DBManager
-from ehp.tests.utils.test_client import EHPTestClient
-from ehp.utils.authentication import hash_password
-from ehp.utils.date_utils import timezone_now
+from ehp.tests.utils.mocks import hashed_test_password
+from ehp.tests.utils.test_client import AsyncEHPTestClient, EHPTestClient
 
 
 @dataclass
@@ -67,27 +70,92 @@ class AuthenticatedClientProxy:
         return self.test_client.delete(url, params, include_auth, **kwargs)
 
 
+@dataclass
+class AsyncAuthenticatedClientProxy:
+    """Proxy for authenticated client operations over ``AsyncEHPTestClient``.
+    Same interface as AuthenticatedClientProxy, with awaitable request methods."""
+
+    user: User
+    auth: Authentication
+    session_data: TokenPayload
+    test_client: AsyncEHPTestClient
+
+    def get_headers(self, include_auth: bool = False) -> Dict[str, str]:
+        return self.test_client.get_headers(include_auth)
+
+    async def get(
+        self,
+        url: str,
+        params: Dict[str, Any] | None = None,
+        include_auth: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.test_client.get(url, params, include_auth, **kwargs)
+
+    async def post(
+        self,
+        url: str,
+        json: Dict[str, Any] | None = None,
+        include_auth: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.test_client.post(url, json, include_auth, **kwargs)
+
+    async def put(
+        self,
+        url: str,
+        json: Dict[str, Any] | None = None,
+        include_auth: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.test_client.put(url, json, include_auth, **kwargs)
+
+    async def delete(
+        self,
+        url: str,
+        params: Dict[str, Any] | None = None,
+        include_auth: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        return await self.test_client.delete(url, params, include_auth, **kwargs)
+
+
 USER_ID = 123
 AUTH_ID = 123
+# Fixed so the mock user is identical in every test
+USER_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest.fixture
-async def authenticated_client(
-    test_client: EHPTestClient, setup_jwt: None, test_db_manager: DBManager
-):
-    """Fixture to create an authenticated client for testing.
-    This fixture sets up a mock user and authentication, then returns an AuthenticatedClientProxy instance.
-    It uses the provided test client and database manager to create the necessary authentication and user records.
+
+@dataclass(frozen=True)
+class AuthUserState:
+    """Authentication state shared by every test of a module.
+    The hashed password and the JWT generator do not depend on the per-test database,
+    so they are built once per module instead of once per test."""
+
+    user_pwd: str
+    jwt_generator: JWTGenerator
+
+
+@pytest.fixture(scope="module")
+def _auth_user_module() -> AuthUserState:
+    """Module-scoped fixture with the expensive, database-independent part of the
+    authentication setup.
+    The JWT secret is the same one ``setup_jwt`` stores in the mocked secrets manager,
+    so tokens signed here are accepted by the application.
     """
-    del setup_jwt  # Used only to invoke the fixture
-    session = test_db_manager.get_session()
-    auth_repo = AuthenticationRepository(session)
-    user_repo = UserRepository(session)
+    return AuthUserState(
+        user_pwd=hashed_test_password(),
+        jwt_generator=JWTGenerator(secret_getter=lambda _: settings.SECRET_KEY),
+    )
+
 
+def _build_authenticated_user(auth_state: AuthUserState) -> tuple[Authentication, User]:
+    """Build the mock user and authentication rows without adding them to a session."""
     authentication = Authentication(
         id=AUTH_ID,
         user_name="mockuser",
         user_email="mock@example.com",
-        user_pwd=hash_password("Te$tPassword123"),  # Using hash_password utility
+        user_pwd=auth_state.user_pwd,
         is_active="1",
         is_confirmed="1",
         retry_count=0,
@@ -95,21 +163,48 @@ async def authenticated_client(
     user = User(
         id=USER_ID,
         full_name="Mock User",
-        created_at=timezone_now(),
+        created_at=USER_CREATED_AT,
         auth_id=authentication.id,
     )
+    return authentication, user
 
-    _ = await auth_repo.create(authentication)
-    _ = await user_repo.create(user)
 
+async def _create_authenticated_user(
+    test_db_manager: DBManager, auth_state: AuthUserState
+) -> tuple[Authentication, User, TokenPayload]:
+    """Insert the mock user and authentication rows and open a session for them."""
+    session = test_db_manager.get_session()
+    authentication, user = _build_authenticated_user(auth_state)
     authentication.user = user
 
-    _ = await auth_repo.update(authentication)
+    # Both rows go out in a single flush; the test session is rolled back, so no commit
+    session.add_all([authentication, user])
+    await session.flush()
 
-    session_manager = SessionManager()
+    session_manager = SessionManager(jwt_generator=auth_state.jwt_generator)
     authentication_payload = session_manager.create_session(
         str(authentication.id), authentication.user_email, with_refresh=False
     )
+    return authentication, user, authentication_payload
+
+
+@pytest.fixture
+async def authenticated_client(
+    test_client: EHPTestClient,
+    setup_jwt: None,
+    test_db_manager: DBManager,
+    _auth_user_module: AuthUserState,
+):
+    """Fixture to create an authenticated client for testing.
+    This fixture sets up a mock user and authentication, then returns an AuthenticatedClientProxy instance.
+    It uses the provided test client and database manager to create the necessary authentication and user records.
+    The test database is rebuilt for every test, so only the rows and the session
+    are created here.
+    """
+    del setup_jwt  # Used only to invoke the fixture
+    authentication, user, authentication_payload = await _create_authenticated_user(
+        test_db_manager, _auth_user_module
+    )
 
     test_client.auth_token = authentication_payload.access_token
     return AuthenticatedClientProxy(
@@ -118,3 +213,65 @@ async def authenticated_client(
         authentication_payload,
         test_client,
     )
+
+
+@pytest.fixture
+async def async_authenticated_client(
+    async_test_client: AsyncEHPTestClient,
+    setup_jwt: None,
+    test_db_manager: DBManager,
+    _auth_user_module: AuthUserState,
+):
+    """Async counterpart of ``authenticated_client``.
+    Returns an AsyncAuthenticatedClientProxy whose requests must be awaited.
+    """
+    del setup_jwt  # Used only to invoke the fixture
+    authentication, user, authentication_payload = await _create_authenticated_user(
+        test_db_manager, _auth_user_module
+    )
+
+    async_test_client.auth_token = authentication_payload.access_token
+    return AsyncAuthenticatedClientProxy(
+        user,
+        authentication,
+        authentication_payload,
+        async_test_client,
+    )
+
+
+@pytest.fixture
+def auth_dependency_override(
+    test_client: EHPTestClient, _auth_user_module: AuthUserState
+) -> Generator[AuthenticatedClientProxy]:
+    """Authenticated client for tests that only hit mocked repositories.
+    ``authorized_session`` and ``get_authentication`` are overridden to return the
+    mock user, so no Authentication or User rows are inserted and no session is
+    stored in Redis.
+    Use ``authenticated_client`` for tests that exercise the real authentication flow.
+    """
+    authentication, user = _build_authenticated_user(_auth_user_module)
+    authentication.user = user
+
+    app = test_client.app
+    app.dependency_overrides[authorized_session] = lambda: {
+        "sub": str(authentication.id)
+    }
+    app.dependency_overrides[get_authentication] = lambda: authentication
+
+    yield AuthenticatedClientProxy(
+        user,
+        authentication,
+        TokenPayload(access_token=test_client.auth_token, expires_at=0),
+        test_client,
+    )
+
+    _ = app.dependency_overrides.pop(authorized_session, None)
+    _ = app.dependency_overrides.pop(get_authentication, None)
+
+
+@pytest.fixture
+def wikiclip_repo(test_db_manager: DBManager) -> WikiClipRepository:
+    """Real repository bound to the test database session.
+    The session and its rows are rolled back after every test, so this cannot be
+    shared across tests."""
+    return WikiClipRepository(test_db_manager.get_session())
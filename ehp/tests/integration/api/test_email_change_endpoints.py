@@ -4,14 +4,13 @@ from unittest.mock import patch
 
 import pytest
 
-from ehp.base.jwt_helper import ACCESS_TOKEN_EXPIRE, JWTGenerator
+from ehp.base.jwt_helper import ACCESS_TOKEN_EXPIRE
 from ehp.base.session import SessionManager
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.profile import Profile
 from ehp.core.models.db.user import User
 from ehp.core.repositories.authentication import AuthenticationRepository
 from ehp.core.repositories.base import BaseRepository
-from ehp.core.services.user import generate_email_change_token
 from ehp.db import DBManager
 from ehp.tests.utils.test_client import EHPTestClient
 from ehp.utils import constants
@@ -32,14 +31,16 @@ class TestEmailChangeEndpoints:
         """Setup authenticated client with user."""
         # Create default profiles
         profile_repository = BaseRepository(test_db_manager.get_session(), Profile)
-        for profilename, profilecode in constants.PROFILE_IDS.items():
-            await profile_repository.create(
+        await profile_repository.bulk_create(
+            [
                 Profile(
                     id=profilecode,
                     name=profilename,
                     code=profilename.lower(),
                 )
-            )
+                for profilename, profilecode in constants.PROFILE_IDS.items()
+            ]
+        )
 
         # Create authentication and user
         authentication = Authentication(
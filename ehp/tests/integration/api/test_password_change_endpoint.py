@@ -1,6 +1,5 @@
 import pytest
 from unittest.mock import patch, AsyncMock
-from fastapi import FastAPI
 
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.user import User
@@ -25,14 +25,16 @@ class TestReadingSettingsEndpoints:
     ):
         """Setup authenticated client with user data, following the project's working pattern."""
         profile_repository = BaseRepository(test_db_manager.get_session(), Profile)
-        for profilename, profilecode in constants.PROFILE_IDS.items():
-            await profile_repository.create(
+        await profile_repository.bulk_create(
+            [
                 Profile(
                     id=profilecode,
                     name=profilename,
                     code=profilename.lower(),
                 )
-            )
+                for profilename, profilecode in constants.PROFILE_IDS.items()
+            ]
+        )
 
         authentication = Authentication(
             id=123,
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock, call
+from unittest.mock import AsyncMock, patch
 
 from ehp.core.models.db.authentication import Authentication
 from ehp.tests.utils.test_client import EHPTestClient
@@ -1,17 +1,28 @@
+import asyncio
+from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock, create_autospec, patch
+from urllib.parse import urlencode
 import zipfile
 
 import odfdo
+import orjson
 import pytest
 from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 
+import ehp.core.services.wikiclip as wikiclip_service
+from ehp.core.models.db.tag import Tag
 from ehp.core.models.db.wikiclip import WikiClip
+from ehp.core.models.schema.duplicate_check import DuplicateCheckResponseSchema
 from ehp.core.models.schema.paging import PagedResponse
 from ehp.core.models.schema.wikiclip import (
     SUMMARY_MAX_LENGTH,
+    TrendingWikiClipSchema,
     WikiClipResponseSchema,
     WikiClipSearchSchema,
     WikiClipSearchSortStrategy,
@@ -27,108 +38,381 @@ from ehp.core.services.documents import (
     as_bytesio,
 )
 from ehp.db.db_manager import DBManager
+from ehp.tests.integration.api.conftest import AsyncAuthenticatedClientProxy
 from ehp.tests.integration.conftest import USER_ID, AuthenticatedClientProxy
-from ehp.tests.utils.test_client import EHPTestClient
+from ehp.tests.utils.test_client import AsyncEHPTestClient, EHPTestClient
+
+
+pytestmark = pytest.mark.integration
+
+TEST_DATETIME = datetime(2024, 6, 16, 12, 0, 0)
+TEST_DATETIME_ISO = TEST_DATETIME.isoformat()
+# Bounds around TEST_DATETIME for the created_before/created_after search filters
+DAY_BEFORE_TEST = TEST_DATETIME - timedelta(days=1)
+DAY_AFTER_TEST = TEST_DATETIME + timedelta(days=1)
+TWO_DAYS_AFTER_TEST = TEST_DATETIME + timedelta(days=2)
+# Shared by every test: treat as read-only and build a new dict to change it
+VALID_WIKICLIP_DATA = {
+    "title": "Test WikiClip Article",
+    "content": "This is a test content for the WikiClip article.",
+    "url": "https://example.com/test-article",
+    "created_at": TEST_DATETIME_ISO,
+    "related_links": [
+        "https://example.com/related1",
+        "https://example.com/related2",
+    ],
+}
+# Request body for the success paths, serialized once instead of on every post
+VALID_WIKICLIP_JSON = orjson.dumps(VALID_WIKICLIP_DATA)
+JSON_HEADERS = {"Content-Type": "application/json"}
+# ORM bulk INSERT for seeding plain row dicts; built once and shared by the DB-backed tests
+WIKICLIP_INSERT = insert(WikiClip)
+# WikiClips returned by the mocked repository. The service only reads them,
+# so every test can share the same instances.
+CREATED_WIKICLIP = WikiClip(
+    id=1,
+    title="Test WikiClip Article",
+    content="This is a test content for the WikiClip article.",
+    summary="This is a test content for the WikiClip article.",
+    url="https://example.com/test-article",
+    created_at=TEST_DATETIME,
+    related_links=[
+        "https://example.com/related1",
+        "https://example.com/related2",
+    ],
+    user_id=USER_ID,
+)
+# What the create endpoint returns for CREATED_WIKICLIP
+CREATED_WIKICLIP_RESPONSE = {
+    "id": 1,
+    "title": "Test WikiClip Article",
+    "url": "https://example.com/test-article",
+    "related_links": [
+        "https://example.com/related1",
+        "https://example.com/related2",
+    ],
+    "created_at": TEST_DATETIME_ISO,
+    "content": "This is a test content for the WikiClip article.",
+    "summary": "This is a test content for the WikiClip article.",
+}
+# The get endpoint leaves out the summary and adds the reader's settings
+CREATED_WIKICLIP_DETAIL = {
+    key: value for key, value in CREATED_WIKICLIP_RESPONSE.items() if key != "summary"
+}
+CREATED_WIKICLIP_NO_LINKS = WikiClip(
+    id=2,
+    title="Test WikiClip No Links",
+    content="Test content without related links",
+    summary="Test content without related links",
+    url="https://example.com/no-links",
+    created_at=TEST_DATETIME,
+    related_links=None,
+    user_id=USER_ID,
+)
+CREATED_WIKICLIP_NO_LINKS_RESPONSE = {
+    "id": 2,
+    "title": "Test WikiClip No Links",
+    "url": "https://example.com/no-links",
+    "related_links": None,
+    "created_at": TEST_DATETIME_ISO,
+    "content": "Test content without related links",
+    "summary": "Test content without related links",
+}
+# Parses the search and suggested pages; the validator is built once here
+PAGED_WIKICLIPS_ADAPTER = TypeAdapter(
+    PagedResponse[WikiClipResponseSchema, WikiClipSearchSchema]
+)
+
+# Filters the search endpoint echoes back when a query parameter is left out
+DEFAULT_SEARCH_FILTERS = {
+    "search_term": None,
+    "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_DESC,
+    "created_before": None,
+    "created_after": None,
+    "filter_by_user": False,
+}
+
+# (query, expected clip ids in order, expected total) against the search_clips fixture
+SEARCH_WIKICLIPS_CASES = [
+    pytest.param(
+        {
+            "page": 1,
+            "size": 2,
+            "search_term": "Test Article",
+            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_DESC,
+            "created_before": TWO_DAYS_AFTER_TEST,
+            "created_after": TEST_DATETIME,
+            "filter_by_user": True,
+        },
+        [1, 2],
+        3,
+        id="with_filters",
+    ),
+    pytest.param(
+        {
+            "page": 1,
+            "size": 10,
+            "search_term": "Nonexistent Article",
+            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_DESC,
+            "created_before": DAY_BEFORE_TEST,
+            "created_after": DAY_AFTER_TEST,
+            "filter_by_user": True,
+        },
+        [],
+        0,
+        id="no_results",
+    ),
+    pytest.param(
+        {"page": 2, "size": 10, "filter_by_user": True},
+        list(range(11, 21)),
+        20,
+        id="second_page",
+    ),
+    pytest.param(
+        {
+            "page": 1,
+            "size": 5,
+            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_ASC,
+            "filter_by_user": True,
+        },
+        [20, 19, 18, 17, 16],
+        20,
+        id="created_at_asc",
+    ),
+]
+
+# The queries alone, for tests that only check what reaches the repository
+SEARCH_WIKICLIPS_QUERIES = [
+    pytest.param(case.values[0], id=case.id) for case in SEARCH_WIKICLIPS_CASES
+]
+
+# (case id, payload) rejected by schema validation; sent together in one sweep
+INVALID_WIKICLIP_PAYLOADS: list[tuple[str, dict[str, Any]]] = [
+    (
+        "empty_title",
+        {
+            "title": "",  # Empty title should fail validation
+            "content": "Valid content",
+            "url": "https://example.com/test",
+            "created_at": TEST_DATETIME_ISO,
+        },
+    ),
+    ("missing_fields", {"title": "Test Title"}),  # Missing content, url, created_at
+    # Exceeds 500 character limit
+    ("long_title", {**VALID_WIKICLIP_DATA, "title": "x" * 501}),
+    # Exceeds 2000 character limit
+    ("long_url", {**VALID_WIKICLIP_DATA, "url": "https://example.com/" + "x" * 2000}),
+    (
+        # Exceeds 100 link limit
+        "too_many_related_links",
+        {
+            **VALID_WIKICLIP_DATA,
+            "related_links": [f"https://example{i}.com" for i in range(101)],
+        },
+    ),
+]
+
+# (extension, format name used in the error detail) for the invalid document uploads
+INVALID_DOCUMENT_FORMATS = [
+    pytest.param("json", "JSON", id="json"),
+    pytest.param("xml", "XML", id="xml"),
+    pytest.param("html", "HTML", id="html"),
+    pytest.param("odt", "ODT", id="odt"),
+    pytest.param("docx", "DOCX", id="docx"),
+    pytest.param("pdf", "PDF", id="pdf"),
+]
+
+# (WikiClip fields, tag descriptions, field of the listed page, expected value)
+# for a single page returned by /wikiclip/my
+MY_PAGES_FIELD_CASES = [
+    pytest.param(
+        {
+            "title": "Long Article",
+            "content": "A" * 250,
+            # Mimics generate_summary: first 100 chars + "...", under the 200 char limit
+            "summary": "A" * 100 + "...",
+            "url": "https://example.com/long",
+        },
+        [],
+        "content_summary",
+        "A" * 100 + "...",
+        id="content_summary_truncation",
+    ),
+    pytest.param(
+        {
+            "title": "Multi-section Article",
+            "content": "Section 1 content.\n\nSection 2 content.\n\nSection 3 content.",
+            "summary": "Section 1 content.\n\nSection 2 content.\n\nSection 3 content.",
+            "url": "https://example.com/sections",
+        },
+        [],
+        # Sections are separated by blank lines
+        "sections_count",
+        3,
+        id="sections_count",
+    ),
+    pytest.param(
+        {
+            "title": "Tagged Article",
+            "content": "Article about technology and programming",
+            "summary": "Article about technology and programming",
+            "url": "https://example.com/tagged",
+        },
+        ["Technology", "Programming"],
+        "tags",
+        ["Technology", "Programming"],
+        id="tags",
+    ),
+]
+
+DUPLICATE_CHECK_PARAMS = {
+    "url": "https://example.com/test-article",
+    "title": "Test Article",
+    "hours_threshold": 24,
+}
+
+# Accepted queries that the mocked repository reports as not duplicated
+VALID_DUPLICATE_CHECK_PARAMS = [
+    pytest.param({**DUPLICATE_CHECK_PARAMS, "hours_threshold": 1}, id="minimum_threshold"),
+    pytest.param({**DUPLICATE_CHECK_PARAMS, "hours_threshold": 96}, id="maximum_threshold"),
+    pytest.param(
+        {
+            "url": "https://example.com/test-article?param=value&other=123",
+            "title": "Test Article: Special Characters & Symbols!",
+            "hours_threshold": 12,
+        },
+        id="special_characters",
+    ),
+]
+
+# (case id, query) rejected by schema validation; sent together in one sweep
+INVALID_DUPLICATE_CHECK_PARAMS: list[tuple[str, dict[str, Any]]] = [
+    # Below minimum
+    ("threshold_too_low", {**DUPLICATE_CHECK_PARAMS, "hours_threshold": 0}),
+    # Above maximum (96)
+    ("threshold_too_high", {**DUPLICATE_CHECK_PARAMS, "hours_threshold": 97}),
+    # Every query parameter is required: drop one at a time
+    *(
+        (
+            f"missing_{missing}",
+            {key: value for key, value in DUPLICATE_CHECK_PARAMS.items() if key != missing},
+        )
+        for missing in DUPLICATE_CHECK_PARAMS
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def repo_mock_template() -> MagicMock:
+    """Autospec'd repository instance built once per module.
+    Autospeccing walks every attribute of ``WikiClipRepository`` to copy its call
+    signatures and turns coroutine methods into ``AsyncMock`` children.
+    Resetting the existing mock is much cheaper than building it again."""
+    return create_autospec(WikiClipRepository, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def mock_repo(repo_mock_template: MagicMock) -> MagicMock:
+    """Repository mock with no recorded calls, return values or side effects."""
+    repo_mock_template.reset_mock(return_value=True, side_effect=True)
+    return repo_mock_template
+
+
+@pytest.fixture(scope="module")
+def repo_class_template() -> MagicMock:
+    """Stand-in for the ``WikiClipRepository`` class, built once per module."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_repo_class(
+    repo_class_template: MagicMock, mock_repo: MagicMock
+) -> Generator[MagicMock]:
+    """Replace ``WikiClipRepository`` in the wikiclip service for one test.
+    The service module is resolved once at import, so ``patch.object`` skips the
+    per-test target lookup done by ``@patch("ehp.core.services.wikiclip.WikiClipRepository")``.
+    Instantiating the patched class returns ``mock_repo``."""
+    repo_class_template.reset_mock()
+    repo_class_template.return_value = mock_repo
+    with patch.object(wikiclip_service, "WikiClipRepository", repo_class_template):
+        yield repo_class_template
 
 
-@pytest.mark.integration
 class TestWikiClipEndpoints:
     """Integration tests for WikiClip API endpoints."""
 
-    def setup_method(self):
-        """Setup test data for each test method."""
-        self.test_datetime = datetime(2024, 6, 16, 12, 0, 0)
-        self.valid_wikiclip_data = {
-            "title": "Test WikiClip Article",
-            "content": "This is a test content for the WikiClip article.",
-            "url": "https://example.com/test-article",
-            "created_at": self.test_datetime.isoformat(),
-            "related_links": [
-                "https://example.com/related1",
-                "https://example.com/related2",
-            ],
-        }
-        self.created_wikiclip = WikiClip(
-            id=1,
-            title="Test WikiClip Article",
-            content="This is a test content for the WikiClip article.",
-            summary="This is a test content for the WikiClip article.",
-            url="https://example.com/test-article",
-            created_at=self.test_datetime,
-            related_links=[
-                "https://example.com/related1",
-                "https://example.com/related2",
-            ],
-            user_id=USER_ID,
-        )
+    test_datetime = TEST_DATETIME
+    valid_wikiclip_json = VALID_WIKICLIP_JSON
+    created_wikiclip = CREATED_WIKICLIP
+
+    @pytest.fixture
+    def authenticated_client(
+        self, auth_dependency_override: AuthenticatedClientProxy
+    ) -> AuthenticatedClientProxy:
+        """No test in this class exercises the login flow, so skip the user inserts."""
+        return auth_dependency_override
 
     # ============================================================================
     # CREATE WIKICLIP TESTS
     # ============================================================================
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_save_wikiclip_success(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test successful WikiClip creation."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.create.return_value = self.created_wikiclip
 
         # Make request
         response = authenticated_client.post(
-            "/wikiclip/", json=self.valid_wikiclip_data, include_auth=True
+            "/wikiclip/", content=self.valid_wikiclip_json, headers=JSON_HEADERS
         )
 
         # Assertions
         assert response.status_code == 201
-        response_data = response.json()
-        assert response_data["id"] == 1
-        assert response_data["title"] == "Test WikiClip Article"
-        assert response_data["url"] == "https://example.com/test-article"
-        assert response_data["created_at"] == self.test_datetime.isoformat()
+        assert orjson.loads(response.content) == CREATED_WIKICLIP_RESPONSE
 
         # Verify repository calls
         mock_repo.create.assert_called_once()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_save_wikiclip_repository_error(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip creation with repository error."""
         # Setup mock repository
         exc = Exception("Database error")
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.create.side_effect = exc
 
         # Make request
-        with patch("ehp.utils.base.log_error"):
-            # This will capture the log error call
-            response = authenticated_client.post(
-                "/wikiclip/", json=self.valid_wikiclip_data, include_auth=True
-            )
+        response = authenticated_client.post(
+            "/wikiclip/", content=self.valid_wikiclip_json, headers=JSON_HEADERS
+        )
 
         # Assertions
         assert response.status_code == 500
-        assert response.json()["detail"] == "Internal server error"
+        assert orjson.loads(response.content)["detail"] == "Internal server error"
 
         # Verify repository calls
         mock_repo.create.assert_called_once()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_content_success(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test successful WikiClip content retrieval."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.return_value = self.created_wikiclip
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1/content", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1/content")
 
         # Assertions
         assert response.status_code == 200
@@ -138,46 +422,47 @@ class TestWikiClipEndpoints:
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(1)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_content_not_found(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip content retrieval when not found."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.side_effect = HTTPException(
             status_code=404, detail="WikiClip not found"
         )
 
         # Make request
-        response = authenticated_client.get("/wikiclip/999/content", include_auth=True)
+        response = authenticated_client.get("/wikiclip/999/content")
 
         # Assertions
         assert response.status_code == 404
-        assert response.json()["detail"] == "WikiClip not found"
+        assert orjson.loads(response.content)["detail"] == "WikiClip not found"
 
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(999)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    @patch("ehp.core.services.wikiclip.log_error")
+    @patch.object(wikiclip_service, "log_error")
     def test_get_wikiclip_content_repository_error(
-        self, mock_log_error, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_log_error,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip content retrieval with repository error."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         exc = Exception("Database error")
         mock_repo.get_by_id_or_404.side_effect = exc
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1/content", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1/content")
 
         # Assertions
         assert response.status_code == 500
-        assert response.json()["detail"] == "Internal server error"
+        assert orjson.loads(response.content)["detail"] == "Internal server error"
 
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(1)
@@ -187,11 +472,11 @@ class TestWikiClipEndpoints:
             f"Error getting WikiClip content 1: {exc}"
         )
 
-    def test_get_wikiclip_content_invalid_id(self, authenticated_client: EHPTestClient):
+    def test_get_wikiclip_content_invalid_id(
+        self, authenticated_client: AuthenticatedClientProxy
+    ):
         """Test WikiClip content retrieval with invalid ID format."""
-        response = authenticated_client.get(
-            "/wikiclip/invalid/content", include_auth=True
-        )
+        response = authenticated_client.get("/wikiclip/invalid/content")
 
         # Should return 422 for invalid path parameter type
         assert response.status_code == 422
@@ -203,160 +488,97 @@ class TestWikiClipEndpoints:
         # Should return 403 for unauthenticated request
         assert response.status_code == 403
 
-    def test_save_wikiclip_invalid_data(self, authenticated_client: EHPTestClient):
-        """Test WikiClip creation with invalid data."""
-        invalid_data = {
-            "title": "",  # Empty title should fail validation
-            "content": "Valid content",
-            "url": "https://example.com/test",
-            "created_at": self.test_datetime.isoformat(),
-        }
-
-        response = authenticated_client.post(
-            "/wikiclip/", json=invalid_data, include_auth=True
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_save_wikiclip_missing_fields(self, authenticated_client: EHPTestClient):
-        """Test WikiClip creation with missing required fields."""
-        incomplete_data = {
-            "title": "Test Title",
-            # Missing content, url, created_at
-        }
-
-        response = authenticated_client.post(
-            "/wikiclip/", json=incomplete_data, include_auth=True
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_save_wikiclip_long_title(self, authenticated_client: EHPTestClient):
-        """Test WikiClip creation with title exceeding length limit."""
-        invalid_data = self.valid_wikiclip_data.copy()
-        invalid_data["title"] = "x" * 501  # Exceeds 500 character limit
-
-        response = authenticated_client.post(
-            "/wikiclip/", json=invalid_data, include_auth=True
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_save_wikiclip_long_url(self, authenticated_client: EHPTestClient):
-        """Test WikiClip creation with URL exceeding length limit."""
-        invalid_data = self.valid_wikiclip_data.copy()
-        invalid_data["url"] = (
-            "https://example.com/" + "x" * 2000
-        )  # Exceeds 2000 character limit
-
-        response = authenticated_client.post(
-            "/wikiclip/", json=invalid_data, include_auth=True
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_save_wikiclip_too_many_related_links(
-        self, authenticated_client: EHPTestClient
+    async def test_save_wikiclip_validation_errors(
+        self,
+        authenticated_client: AuthenticatedClientProxy,
+        async_test_client: AsyncEHPTestClient,
     ):
-        """Test WikiClip creation with too many related links."""
-        invalid_data = self.valid_wikiclip_data.copy()
-        invalid_data["related_links"] = [
-            f"https://example{i}.com" for i in range(101)
-        ]  # Exceeds 100 link limit
-
-        response = authenticated_client.post(
-            "/wikiclip/", json=invalid_data, include_auth=True
+        """Test WikiClip creation with payloads rejected by schema validation.
+        The payloads never reach the repository, so they are all sent concurrently."""
+        del authenticated_client  # Used only to override the auth dependencies
+        responses = await asyncio.gather(
+            *(
+                async_test_client.post("/wikiclip/", json=payload)
+                for _, payload in INVALID_WIKICLIP_PAYLOADS
+            )
         )
 
-        assert response.status_code == 422  # Validation error
+        # Validation error for every payload, keyed by case id to name the one that fails
+        assert {
+            case_id: response.status_code
+            for (case_id, _), response in zip(INVALID_WIKICLIP_PAYLOADS, responses)
+        } == {case_id: 422 for case_id, _ in INVALID_WIKICLIP_PAYLOADS}
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_save_wikiclip_without_related_links(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
         """Test WikiClip creation without related links (optional field)."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-
-        created_wikiclip_no_links = WikiClip(
-            id=2,
-            title="Test WikiClip No Links",
-            content="Test content without related links",
-            summary="Test content without related links",
-            url="https://example.com/no-links",
-            created_at=self.test_datetime,
-            related_links=None,
-            user_id=authenticated_client.user.id,
-        )
-        mock_repo.create.return_value = created_wikiclip_no_links
+        mock_repo.create.return_value = CREATED_WIKICLIP_NO_LINKS
 
         # Test data without related_links
         test_data = {
             "title": "Test WikiClip No Links",
             "content": "Test content without related links",
             "url": "https://example.com/no-links",
-            "created_at": self.test_datetime.isoformat(),
+            "created_at": TEST_DATETIME_ISO,
         }
 
         # Make request
-        response = authenticated_client.post(
-            "/wikiclip/", json=test_data, include_auth=True
-        )
+        response = authenticated_client.post("/wikiclip/", json=test_data)
 
         # Assertions
         assert response.status_code == 201
-        response_data = response.json()
-        assert response_data["id"] == 2
-        assert response_data["title"] == "Test WikiClip No Links"
-        assert response_data["url"] == "https://example.com/no-links"
+        assert orjson.loads(response.content) == CREATED_WIKICLIP_NO_LINKS_RESPONSE
 
         # Verify repository calls
         mock_repo.create.assert_called_once()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_save_wikiclip_http_exception(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip creation that raises HTTPException."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         # Simulate an HTTPException being raised
         mock_repo.create.side_effect = HTTPException(status_code=409, detail="Conflict")
 
         # Make request
         response = authenticated_client.post(
-            "/wikiclip/", json=self.valid_wikiclip_data, include_auth=True
+            "/wikiclip/", content=self.valid_wikiclip_json, headers=JSON_HEADERS
         )
 
         # Assertions
         assert response.status_code == 409
-        assert response.json()["detail"] == "Conflict"
+        assert orjson.loads(response.content)["detail"] == "Conflict"
 
         # Verify repository calls
         mock_repo.create.assert_called_once()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_save_wikiclip_generic_exception(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip creation that raises a generic exception."""
         # Setup mock repository
         exc = Exception("Unexpected error")
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.create.side_effect = exc
 
         # Make request
-        with patch("ehp.utils.base.log_error"):
-            response = authenticated_client.post(
-                "/wikiclip/", json=self.valid_wikiclip_data, include_auth=True
-            )
+        response = authenticated_client.post(
+            "/wikiclip/", content=self.valid_wikiclip_json, headers=JSON_HEADERS
+        )
 
         # Assertions
         assert response.status_code == 500
-        assert response.json()["detail"] == "Internal server error"
+        assert orjson.loads(response.content)["detail"] == "Internal server error"
 
         # Verify repository calls
         mock_repo.create.assert_called_once()
@@ -365,69 +587,69 @@ class TestWikiClipEndpoints:
     # GET WIKICLIP TESTS
     # ============================================================================
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_success(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test successful WikiClip retrieval."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.return_value = self.created_wikiclip
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1")
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["id"] == 1
-        assert response_data["title"] == "Test WikiClip Article"
-        assert response_data["url"] == "https://example.com/test-article"
-        assert response_data["created_at"] == self.test_datetime.isoformat()
+        response_data = orjson.loads(response.content)
+        # Reading settings are covered by test_wikiclip_reading_settings.py
+        del response_data["reading_settings"]
+        assert response_data == CREATED_WIKICLIP_DETAIL
 
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(1)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_not_found(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip retrieval when not found."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.side_effect = HTTPException(
             status_code=404, detail="WikiClip not found"
         )
 
         # Make request
-        response = authenticated_client.get("/wikiclip/999", include_auth=True)
+        response = authenticated_client.get("/wikiclip/999")
 
         # Assertions
         assert response.status_code == 404
-        assert response.json()["detail"] == "WikiClip not found"
+        assert orjson.loads(response.content)["detail"] == "WikiClip not found"
 
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(999)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_repository_error(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip retrieval with repository error."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.side_effect = Exception("Database error")
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1")
 
         # Assertions
         assert response.status_code == 500
         assert (
-            response.json()["detail"] == "Could not retrieve WikiClip due to an error"
+            orjson.loads(response.content)["detail"]
+            == "Could not retrieve WikiClip due to an error"
         )
 
         # Verify repository calls
@@ -435,51 +657,52 @@ class TestWikiClipEndpoints:
 
     def test_get_wikiclip_invalid_id(self, authenticated_client: EHPTestClient):
         """Test WikiClip retrieval with invalid ID format."""
-        response = authenticated_client.get("/wikiclip/invalid", include_auth=True)
+        response = authenticated_client.get("/wikiclip/invalid")
 
         # Should return 422 for invalid path parameter type
         assert response.status_code == 422
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_http_exception(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip retrieval that raises HTTPException."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.side_effect = HTTPException(
             status_code=404, detail="Not Found"
         )
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1")
 
         # Assertions
         assert response.status_code == 404
-        assert response.json()["detail"] == "Not Found"
+        assert orjson.loads(response.content)["detail"] == "Not Found"
 
         # Verify repository calls
         mock_repo.get_by_id_or_404.assert_called_once_with(1)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_wikiclip_generic_exception(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test WikiClip retrieval that raises a generic exception."""
         # Setup mock repository
         exc = Exception("Database error")
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.get_by_id_or_404.side_effect = exc
 
         # Make request
-        response = authenticated_client.get("/wikiclip/1", include_auth=True)
+        response = authenticated_client.get("/wikiclip/1")
 
         # Assertions
         assert response.status_code == 500
         assert (
-            response.json()["detail"] == "Could not retrieve WikiClip due to an error"
+            orjson.loads(response.content)["detail"]
+            == "Could not retrieve WikiClip due to an error"
         )
 
         # Verify repository calls
@@ -489,14 +712,14 @@ class TestWikiClipEndpoints:
     # DUPLICATE CHECK TESTS
     # ============================================================================
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_duplicate_check_no_duplicate_found(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test duplicate check when no duplicate is found."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.check_duplicate.return_value = (False, None, None)
 
         # Make request
@@ -507,12 +730,11 @@ class TestWikiClipEndpoints:
                 "title": "New Article",
                 "hours_threshold": 23,
             },
-            include_auth=True,
         )
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert response_data["is_duplicate"] is False
         assert response_data["duplicate_article_id"] is None
         assert response_data["duplicate_created_at"] is None
@@ -522,9 +744,11 @@ class TestWikiClipEndpoints:
             "No duplicate found within 23 hours threshold" in response_data["message"]
         )
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_duplicate_check_duplicate_found(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
         """Test duplicate check when a duplicate is found."""
         # Setup mock repository
@@ -540,8 +764,6 @@ class TestWikiClipEndpoints:
             user_id=authenticated_client.user.id,
         )
 
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         # Service expects (is_duplicate, duplicate_article_object, hours_difference)
         mock_repo.check_duplicate.return_value = (True, mock_duplicate_article, 2.5)
 
@@ -553,12 +775,11 @@ class TestWikiClipEndpoints:
                 "title": "Test Article",
                 "hours_threshold": 23,
             },
-            include_auth=True,
         )
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert response_data["is_duplicate"] is True
         assert response_data["duplicate_article_id"] == 123
         assert response_data["duplicate_created_at"] == duplicate_created_at.isoformat()
@@ -566,200 +787,68 @@ class TestWikiClipEndpoints:
         assert response_data["threshold_hours"] == 23
         assert "Duplicate article found" in response_data["message"]
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_duplicate_check_invalid_threshold_too_low(
-        self, mock_repo_class, authenticated_client: EHPTestClient
-    ):
-        """Test duplicate check with invalid threshold (below minimum)."""
-        # Make request with invalid threshold
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-                "hours_threshold": 0,  # Below minimum
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 422  # Validation error
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_duplicate_check_invalid_threshold_too_high(
-        self, mock_repo_class, authenticated_client: EHPTestClient
-    ):
-        """Test duplicate check with invalid threshold (above maximum)."""
-        # Make request with invalid threshold
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-                "hours_threshold": 97,  # Above maximum (96)
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 422  # Validation error
-
-    def test_duplicate_check_missing_url(self, authenticated_client: EHPTestClient):
-        """Test duplicate check with missing URL parameter."""
-        # Make request without URL
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "title": "Test Article",
-                "hours_threshold": 24,
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 422  # Validation error
-
-    def test_duplicate_check_missing_title(self, authenticated_client: EHPTestClient):
-        """Test duplicate check with missing title parameter."""
-        # Make request without title
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "hours_threshold": 24,
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 422  # Validation error
-
-    def test_duplicate_check_missing_threshold(
-        self, authenticated_client: EHPTestClient
+    async def test_duplicate_check_validation_errors(
+        self,
+        authenticated_client: AuthenticatedClientProxy,
+        async_test_client: AsyncEHPTestClient,
     ):
-        """Test duplicate check with missing hours_threshold parameter."""
-        # Make request without hours_threshold
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-            },
-            include_auth=True,
+        """Test duplicate check with missing or out-of-range query parameters.
+        The requests never reach the repository, so they are all sent concurrently."""
+        del authenticated_client  # Used only to override the auth dependencies
+        responses = await asyncio.gather(
+            *(
+                async_test_client.get("/wikiclip/duplicate-check", params=params)
+                for _, params in INVALID_DUPLICATE_CHECK_PARAMS
+            )
         )
 
-        # Assertions
-        assert response.status_code == 422  # Validation error
+        # Validation error for every query, keyed by case id to name the one that fails
+        assert {
+            case_id: response.status_code
+            for (case_id, _), response in zip(INVALID_DUPLICATE_CHECK_PARAMS, responses)
+        } == {case_id: 422 for case_id, _ in INVALID_DUPLICATE_CHECK_PARAMS}
 
     def test_duplicate_check_unauthorized(self, test_client: EHPTestClient):
         """Test duplicate check without authentication."""
         # Make request without authentication
         response = test_client.get(
             "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-                "hours_threshold": 24,
-            },
+            params=DUPLICATE_CHECK_PARAMS,
             include_auth=False,
         )
 
         # Should return 400 or 403 because user is not authenticated for this protected endpoint
         assert response.status_code in [400, 403]
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_duplicate_check_with_minimum_threshold(
-        self, mock_repo_class, authenticated_client: EHPTestClient
-    ):
-        """Test duplicate check with minimum hours threshold (1 hour)."""
-        # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-        mock_repo.check_duplicate.return_value = (False, None, None)
-
-        # Make request with minimum threshold
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-                "hours_threshold": 1,
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["threshold_hours"] == 1
-        assert response_data["is_duplicate"] is False
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_duplicate_check_with_maximum_threshold(
-        self, mock_repo_class, authenticated_client: EHPTestClient
-    ):
-        """Test duplicate check with maximum hours threshold (96 hours)."""
-        # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-        mock_repo.check_duplicate.return_value = (False, None, None)
-
-        # Make request with maximum threshold
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": "https://example.com/test-article",
-                "title": "Test Article",
-                "hours_threshold": 96,  # Maximum allowed
-            },
-            include_auth=True,
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["threshold_hours"] == 96
-        assert response_data["is_duplicate"] is False
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_duplicate_check_with_special_characters_in_params(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+    @pytest.mark.parametrize("params", VALID_DUPLICATE_CHECK_PARAMS)
+    def test_duplicate_check_accepts_params(
+        self,
+        params: dict,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
-        """Test duplicate check with special characters in URL and title."""
+        """Test duplicate check with boundary thresholds and special characters."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.check_duplicate.return_value = (False, None, None)
 
-        # URL and title with special characters
-        test_url = "https://example.com/test-article?param=value&other=123"
-        test_title = "Test Article: Special Characters & Symbols!"
-
         # Make request
-        response = authenticated_client.get(
-            "/wikiclip/duplicate-check",
-            params={
-                "url": test_url,
-                "title": test_title,
-                "hours_threshold": 12,
-            },
-            include_auth=True,
-        )
+        response = authenticated_client.get("/wikiclip/duplicate-check", params=params)
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
-        assert response_data["threshold_hours"] == 12
+        response_data = orjson.loads(response.content)
+        assert response_data["threshold_hours"] == params["hours_threshold"]
         assert response_data["is_duplicate"] is False
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_duplicate_check_repository_error(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test duplicate check with repository error."""
         # Setup mock repository to raise an exception
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.check_duplicate.side_effect = Exception("Database error")
 
         # Make request
@@ -770,22 +859,21 @@ class TestWikiClipEndpoints:
                 "title": "Test Article",
                 "hours_threshold": 12,
             },
-            include_auth=True,
         )
 
         # Assertions
         assert response.status_code == 500
         # Service returns detailed error message with the exception
-        assert response.json()["detail"] == "Internal server error"
+        assert orjson.loads(response.content)["detail"] == "Internal server error"
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_duplicate_check_response_schema_validation(
-        self, mock_repo_class, authenticated_client: EHPTestClient
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: EHPTestClient,
     ):
         """Test that the response matches the expected schema structure."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.check_duplicate.return_value = (False, None, None)
 
         # Make request
@@ -796,46 +884,34 @@ class TestWikiClipEndpoints:
                 "title": "Test Article",
                 "hours_threshold": 18,
             },
-            include_auth=True,
         )
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
-
-        # Verify all required fields are present
-        required_fields = [
-            "is_duplicate",
-            "duplicate_article_id",
-            "duplicate_created_at",
-            "hours_difference",
-            "threshold_hours",
-            "message",
-        ]
-        for field in required_fields:
-            assert field in response_data
-
-        # Verify field types and values
-        assert isinstance(response_data["is_duplicate"], bool)
-        assert (
-            isinstance(response_data["duplicate_article_id"], int)
-            or response_data["duplicate_article_id"] is None
+        # Strict parsing rejects values that only match the schema after coercion
+        response_data = DuplicateCheckResponseSchema.model_validate_json(
+            response.content, strict=True
+        )
+        # Every field is present in the body, including the ones left as None
+        assert response_data.model_fields_set == set(
+            DuplicateCheckResponseSchema.model_fields
         )
-        assert isinstance(response_data["threshold_hours"], int)
-        assert isinstance(response_data["message"], str)
+        assert response_data.is_duplicate is False
+        assert response_data.duplicate_article_id is None
+        assert response_data.threshold_hours == 18
 
     # ============================================================================
     # SEARCH WIKICLIP TESTS
     # ============================================================================
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_search_wikiclips_returns_entries_without_filters(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
         """Test searching WikiClips without any filters."""
         # Setup mock repository
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
 
         # Mock search results
         mock_search_results = [
@@ -849,235 +925,23 @@ class TestWikiClipEndpoints:
                 related_links=[],
                 user_id=authenticated_client.user.id,
             ),
-        ]
-        mock_repo.search.return_value = mock_search_results
-        mock_repo.count.return_value = len(mock_search_results)
-        # Search parameters
-        search = {
-            "page": 1,
-            "size": 10,
-            "filter_by_user": False,  # No user filter
-        }
-        # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = PagedResponse[
-            WikiClipResponseSchema, WikiClipSearchSchema
-        ].model_validate_json(response.content)
-        assert len(response_data.data) == len(mock_search_results)
-        assert response_data.total_count == len(mock_search_results)
-        assert response_data.page == search["page"]
-        assert response_data.page_size == search["size"]
-        assert response_data.filters is not None
-        assert response_data.filters.search_term is None
-        assert (
-            response_data.filters.sort_by
-            is WikiClipSearchSortStrategy.CREATION_DATE_DESC
-        )
-        assert response_data.filters.created_before is None
-        assert response_data.filters.created_after is None
-        assert response_data.filters.filter_by_user is False
-
-    def test_search_wikiclips_invalid_sort_strategy(
-        self, authenticated_client: EHPTestClient
-    ):
-        """Test searching WikiClips with an invalid sort strategy."""
-        # Search parameters with invalid sort strategy
-        search = {
-            "page": 1,
-            "size": 10,
-            "sort_by": "invalid_sort_strategy",  # Invalid sort strategy
-        }
-
-        # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
-
-        # Should return 422 for invalid query parameter
-        assert response.status_code == 422
-
-    async def test_search_wikiclips_with_filters(
-        self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager
-    ):
-        """Test searching WikiClips with various filters."""
-        # Setup mock repository
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        # Create test data
-        userless_clip = WikiClip(
-            id=5,
-            title="Userless Article",
-            content="Content for userless article.",
-            url="https://example.com/userless-article",
-            created_at=datetime(2024, 6, 15, 12, 0, 0),
-            related_links=[],
-            user_id=None,  # No user associated
-        )
-        clips = [
-            WikiClip(
-                id=1,
-                title="Test Article 1",
-                content="Content for test article 1.",
-                url="https://example.com/test-article-1",
-                created_at=datetime(2024, 6, 16, 12, 0, 0),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            ),
-            WikiClip(
-                id=2,
-                title="Test Article 2",
-                content="Content for test article 2.",
-                url="https://example.com/test-article-2",
-                created_at=datetime(2024, 6, 17, 12, 0, 0),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            ),
-            WikiClip(
-                id=3,
-                title="Test Article 3",
-                content="Content for test article 3.",
-                url="https://example.com/test-article-3",
-                created_at=datetime(2024, 6, 18, 12, 0, 0),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            ),
-            userless_clip,
-        ]
-        # Save test data
-        for clip in clips:
-            await wikiclip_repo.create(clip)
-
-        # Search parameters
-        search = {
-            "page": 1,
-            "size": 2,
-            "search_term": "Test Article",
-            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_DESC,
-            "created_before": datetime(2024, 6, 18, 12, 0, 0).isoformat(),
-            "created_after": datetime(2024, 6, 16, 12, 0, 0).isoformat(),
-            "filter_by_user": True,  # Filter by authenticated user
-        }
-
-        # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
-        # Assertions
-        assert response.status_code == 200
-        response_data = PagedResponse[
-            WikiClipResponseSchema, WikiClipSearchSchema
-        ].model_validate_json(response.content)
-        assert len(response_data.data) == 2
-        assert response_data.total_count == 3
-        assert response_data.page == search["page"]
-        assert response_data.page_size == search["size"]
-        assert response_data.filters is not None
-        assert response_data.filters.search_term == "Test Article"
-        assert (
-            response_data.filters.sort_by
-            is WikiClipSearchSortStrategy.CREATION_DATE_DESC
-        )
-        assert response_data.filters.created_before == datetime(2024, 6, 18, 12, 0, 0)
-        assert response_data.filters.created_after == datetime(2024, 6, 16, 12, 0, 0)
-        assert response_data.filters.filter_by_user is True
-        # Verify that only clips created by the authenticated user are returned
-        for clip in response_data.data:
-            assert clip.id != userless_clip.id
-            assert clip.created_at <= datetime(2024, 6, 18, 12, 0, 0)
-            assert clip.created_at >= datetime(2024, 6, 16, 12, 0, 0)
-
-    async def test_search_wikiclips_no_results(
-        self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager
-    ):
-        """Test searching WikiClips with no results."""
-        # Setup mock repository
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        # Create test data
-        await wikiclip_repo.create(
-            WikiClip(
-                id=1,
-                title="Existing Article",
-                content="Content for existing article.",
-                url="https://example.com/existing-article",
-                created_at=datetime(2024, 6, 16, 12, 0, 0),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            )
-        )
-
-        # Search parameters that will yield no results
-        search = {
-            "page": 1,
-            "size": 10,
-            "search_term": "Nonexistent Article",
-            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_DESC,
-            "created_before": datetime(2024, 6, 15, 12, 0, 0).isoformat(),
-            "created_after": datetime(2024, 6, 17, 12, 0, 0).isoformat(),
-            "filter_by_user": True,
-        }
-
-        # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = PagedResponse[
-            WikiClipResponseSchema, WikiClipSearchSchema
-        ].model_validate_json(response.content)
-        assert len(response_data.data) == 0
-        assert response_data.total_count == 0
-        assert response_data.page == 0
-        assert response_data.page_size == 0
-        assert response_data.filters is None
-
-    async def test_search_wikiclips_second_page(
-        self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager
-    ):
-        """Test searching WikiClips with pagination on the second page."""
-        # Setup mock repository
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        # Create test data
-        clips = [
-            WikiClip(
-                id=i,
-                title=f"Test Article {i}",
-                content=f"Content for test article {i}.",
-                url=f"https://example.com/test-article-{i}",
-                created_at=datetime(2024, 6, 16, 12, 0, 0) - timedelta(minutes=i),  # Different timestamps for deterministic ordering
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            )
-            for i in range(1, 21)  # Create 20 clips
-        ]
-        # Save test data
-        for clip in clips:
-            await wikiclip_repo.create(clip)
-
-        # Search parameters for second page
+        ]
+        mock_repo.search.return_value = mock_search_results
+        mock_repo.count.return_value = len(mock_search_results)
+        # Search parameters
         search = {
-            "page": 2,
+            "page": 1,
             "size": 10,
-            "filter_by_user": True,  # Filter by authenticated user
+            "filter_by_user": False,  # No user filter
         }
-
         # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
+        response = authenticated_client.get("/wikiclip", params=search)
 
         # Assertions
         assert response.status_code == 200
-        response_data = PagedResponse[
-            WikiClipResponseSchema, WikiClipSearchSchema
-        ].model_validate_json(response.content)
-        assert len(response_data.data) == 10
-        assert response_data.total_count == 20
+        response_data = PAGED_WIKICLIPS_ADAPTER.validate_json(response.content)
+        assert len(response_data.data) == len(mock_search_results)
+        assert response_data.total_count == len(mock_search_results)
         assert response_data.page == search["page"]
         assert response_data.page_size == search["size"]
         assert response_data.filters is not None
@@ -1088,110 +952,146 @@ class TestWikiClipEndpoints:
         )
         assert response_data.filters.created_before is None
         assert response_data.filters.created_after is None
-        assert response_data.filters.filter_by_user is True
-        # Verify that the clips returned are from the second page
-        for clip in response_data.data:
-            assert clip.id >= 11
-            assert clip.id <= 20
-
-    async def test_search_wikiclips_created_at_asc(
-        self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager
-    ):
-        """Test searching WikiClips with creation date ascending sort."""
-        # Setup mock repository
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        # Create test data
-        clips = [
-            WikiClip(
-                id=i,
-                title=f"Test Article {i}",
-                content=f"Content for test article {i}.",
-                url=f"https://example.com/test-article-{i}",
-                created_at=datetime(2024, 6, 16, 12, 0, 0) - timedelta(days=i),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            )
-            for i in range(1, 6)  # Create 5 clips with different dates
-        ]
-        # Save test data
-        for clip in clips:
-            await wikiclip_repo.create(clip)
+        assert response_data.filters.filter_by_user is False
 
-        # Search parameters with creation date ascending sort
+    def test_search_wikiclips_invalid_sort_strategy(
+        self, authenticated_client: EHPTestClient
+    ):
+        """Test searching WikiClips with an invalid sort strategy."""
+        # Search parameters with invalid sort strategy
         search = {
             "page": 1,
-            "size": 5,
-            "sort_by": WikiClipSearchSortStrategy.CREATION_DATE_ASC,
-            "filter_by_user": True,  # Filter by authenticated user
+            "size": 10,
+            "sort_by": "invalid_sort_strategy",  # Invalid sort strategy
         }
 
         # Make request
-        response = authenticated_client.get(
-            "/wikiclip", params=search, include_auth=True
-        )
+        response = authenticated_client.get("/wikiclip", params=search)
+
+        # Should return 422 for invalid query parameter
+        assert response.status_code == 422
+
+    @pytest.fixture
+    async def search_clips(
+        self, authenticated_client: AuthenticatedClientProxy, wikiclip_repo: WikiClipRepository
+    ) -> None:
+        """Seed the dataset shared by the search tests.
+        Twenty clips of the authenticated user, one day apart going back from
+        TWO_DAYS_AFTER_TEST, so ids 1-3 fall between TEST_DATETIME and
+        TWO_DAYS_AFTER_TEST, plus one clip with no user.
+        The tests only read the rows back through the API, so they are written
+        as an ORM bulk INSERT of plain dicts without building WikiClip instances."""
+        rows = [
+            {
+                "id": i,
+                "title": f"Test Article {i}",
+                "content": f"Content for test article {i}.",
+                "url": f"https://example.com/test-article-{i}",
+                "created_at": TWO_DAYS_AFTER_TEST - timedelta(days=i - 1),
+                "related_links": [],
+                "user_id": authenticated_client.user.id,
+            }
+            for i in range(1, 21)
+        ]
+        rows.append(
+            {
+                "id": 21,
+                "title": "Userless Article",
+                "content": "Content for userless article.",
+                "url": "https://example.com/userless-article",
+                "created_at": TEST_DATETIME,
+                "related_links": [],
+                "user_id": None,  # No user associated
+            }
+        )
+        _ = await wikiclip_repo.session.execute(WIKICLIP_INSERT, rows)
+
+    @pytest.mark.parametrize(
+        ("search", "expected_ids", "expected_total"), SEARCH_WIKICLIPS_CASES
+    )
+    async def test_search_wikiclips(
+        self,
+        async_test_client: AsyncEHPTestClient,
+        search_clips: None,
+        search: dict,
+        expected_ids: list[int],
+        expected_total: int,
+    ):
+        """Test searching WikiClips with filters, pagination and sorting."""
+        # Make request; urlencode renders the datetimes and sort strategies with str()
+        response = await async_test_client.get(f"/wikiclip/?{urlencode(search)}")
 
         # Assertions
         assert response.status_code == 200
-        response_data = PagedResponse[
-            WikiClipResponseSchema, WikiClipSearchSchema
-        ].model_validate_json(response.content)
-        assert len(response_data.data) == 5
-        assert response_data.total_count == 5
+        response_data = PAGED_WIKICLIPS_ADAPTER.validate_json(response.content)
+        assert [clip.id for clip in response_data.data] == expected_ids
+        assert response_data.total_count == expected_total
+        if not expected_ids:
+            # Empty results carry no paging information or filters
+            assert response_data.page == 0
+            assert response_data.page_size == 0
+            assert response_data.filters is None
+            return
+
         assert response_data.page == search["page"]
         assert response_data.page_size == search["size"]
-        assert response_data.filters is not None
-        assert response_data.filters.search_term is None
-        assert (
-            response_data.filters.sort_by
-            is WikiClipSearchSortStrategy.CREATION_DATE_ASC
+        assert response_data.filters == WikiClipSearchSchema(
+            **{**DEFAULT_SEARCH_FILTERS, **search}
         )
-        assert response_data.filters.created_before is None
-        assert response_data.filters.created_after is None
-        assert response_data.filters.filter_by_user is True
 
-        # Verify that the clips are sorted by creation date ascending
-        previous_date = None
-        for clip in response_data.data:
-            if previous_date:
-                assert clip.created_at >= previous_date
-            previous_date = clip.created_at
+    @pytest.mark.parametrize("search", SEARCH_WIKICLIPS_QUERIES)
+    def test_search_wikiclips_passes_filters_to_repository(
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
+        search: dict,
+    ):
+        """Test that the parsed query reaches the repository unchanged.
+        test_search_wikiclips covers the SQL filtering itself against real rows."""
+        mock_repo.count.return_value = 1
+        mock_repo.search.return_value = [self.created_wikiclip]
+
+        response = authenticated_client.get(f"/wikiclip/?{urlencode(search)}")
+
+        assert response.status_code == 200
+        expected_search = WikiClipSearchSchema(**{**DEFAULT_SEARCH_FILTERS, **search})
+        mock_repo.count.assert_awaited_once_with(USER_ID, expected_search)
+        mock_repo.search.assert_awaited_once_with(USER_ID, expected_search)
 
     async def test_get_suggested_wikiclips_returns_paged_list(
-        self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager
+        self,
+        authenticated_client: AuthenticatedClientProxy,
+        async_test_client: AsyncEHPTestClient,
+        wikiclip_repo: WikiClipRepository,
     ):
-        # Setup mock repository
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-
         ARBITRARY_LENGTH = 300
         # Create test data
-        clips = [
-            WikiClip(
-                id=i,
-                title=f"Test Article {i}",
-                content=f"Content for test article {i}." + ("a" * ARBITRARY_LENGTH),
-                url=f"https://example.com/test-article-{i}",
-                created_at=datetime(2024, 6, 16, 12, 0, 0) - timedelta(days=i),
-                related_links=[],
-                user_id=authenticated_client.user.id,
-            )
+        rows = [
+            {
+                "id": i,
+                "title": f"Test Article {i}",
+                "content": f"Content for test article {i}." + ("a" * ARBITRARY_LENGTH),
+                "url": f"https://example.com/test-article-{i}",
+                "created_at": TEST_DATETIME - timedelta(days=i),
+                "related_links": [],
+                "user_id": authenticated_client.user.id,
+            }
             for i in range(1, 6)  # Create 5 clips with different dates
         ]
         # Save test data
-        for clip in clips:
-            _ = await wikiclip_repo.create(clip)
+        _ = await wikiclip_repo.session.execute(WIKICLIP_INSERT, rows)
 
         search = {"page": "1", "size": "5"}
 
-        response = authenticated_client.get(
-            "/wikiclip/suggested", params=search, include_auth=True
-        )
+        response = await async_test_client.get("/wikiclip/suggested", params=search)
 
         assert response.status_code == 200, response.text
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         data = payload["data"]
 
-        assert len(data) == len(clips)
+        assert len(data) == len(rows)
         assert all(len(item["content"]) == SUMMARY_MAX_LENGTH for item in data)
         assert payload["filters"] == {key: int(value) for key, value in search.items()}
 
@@ -1199,13 +1099,13 @@ class TestWikiClipEndpoints:
     # GET MY SAVED PAGES TESTS (/wikiclip/my)
     # ============================================================================
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_my_pages_success(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
         user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
 
         sample_pages = [
             WikiClip(
@@ -1233,17 +1133,10 @@ class TestWikiClipEndpoints:
         mock_repo.count_user_pages.return_value = 2
         mock_repo.get_user_pages.return_value = sample_pages
 
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
+        response = authenticated_client.get("/wikiclip/my")
 
         assert response.status_code == 200
-        response_data = response.json()
-
-        # Verify response structure
-        assert "data" in response_data
-        assert "total_count" in response_data
-        assert "page" in response_data
-        assert "page_size" in response_data
-        assert "filters" in response_data
+        response_data = orjson.loads(response.content)
 
         # Verify pagination
         assert response_data["total_count"] == 2
@@ -1269,13 +1162,13 @@ class TestWikiClipEndpoints:
         mock_repo.count_user_pages.assert_called_once_with(user.id)
         mock_repo.get_user_pages.assert_called_once_with(user.id, page=1, page_size=20)
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_my_pages_with_pagination(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
         user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
 
         # Create sample page for page 2
         sample_page = WikiClip(
@@ -1293,13 +1186,11 @@ class TestWikiClipEndpoints:
         mock_repo.get_user_pages.return_value = [sample_page]
 
         # Make request with pagination
-        response = authenticated_client.get(
-            "/wikiclip/my?page=2&size=5", include_auth=True
-        )
+        response = authenticated_client.get("/wikiclip/my?page=2&size=5")
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
 
         # Verify pagination was applied
         assert response_data["total_count"] == 15
@@ -1315,162 +1206,78 @@ class TestWikiClipEndpoints:
         # Should return 403 for unauthenticated request
         assert response.status_code == 403
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_my_pages_empty_result(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
-        user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-
         mock_repo.count_user_pages.return_value = 0
         mock_repo.get_user_pages.return_value = []
 
         # Make request
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
+        response = authenticated_client.get("/wikiclip/my")
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
 
         assert response_data["total_count"] == 0
         assert response_data["data"] == []
         assert response_data["page"] == 0
         assert response_data["page_size"] == 0
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_get_my_pages_content_summary_truncation(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
-    ):
-        user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-
-        # Create page with long content
-        long_content = "A" * 250  # 250 characters
-        # Summary should be first 100 chars + "..." (from generate_summary function)
-        sample_page = WikiClip(
-            id=1,
-            title="Long Article",
-            content=long_content,
-            summary="A" * 100 + "...",  # Mimics generate_summary behavior
-            url="https://example.com/long",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            user_id=user.id,
-            related_links=[],
-        )
-
-        mock_repo.count_user_pages.return_value = 1
-        mock_repo.get_user_pages.return_value = [sample_page]
-
-        # Make request
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = response.json()
-
-        page = response_data["data"][0]
-        summary = page["content_summary"]
-
-        # Should be truncated to 200 chars max
-        assert len(summary) <= 200
-        assert summary.endswith("...")
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_get_my_pages_sections_count(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
-    ):
-        user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-
-        # Create page with multiple sections (paragraphs)
-        content_with_sections = (
-            "Section 1 content.\n\nSection 2 content.\n\nSection 3 content."
-        )
-        sample_page = WikiClip(
-            id=1,
-            title="Multi-section Article",
-            content=content_with_sections,
-            summary="Section 1 content.\n\nSection 2 content.\n\nSection 3 content.",  # Full content as summary
-            url="https://example.com/sections",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            user_id=user.id,
-            related_links=[],
-        )
-
-        mock_repo.count_user_pages.return_value = 1
-        mock_repo.get_user_pages.return_value = [sample_page]
-
-        # Make request
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
-
-        # Assertions
-        assert response.status_code == 200
-        response_data = response.json()
-
-        page = response_data["data"][0]
-        # Should count 3 sections based on \n\n separation
-        assert page["sections_count"] == 3
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    def test_get_my_pages_with_tags(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+    @pytest.mark.parametrize(
+        ("page_fields", "tag_descriptions", "field", "expected"), MY_PAGES_FIELD_CASES
+    )
+    def test_get_my_pages_page_field(
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
+        page_fields: dict,
+        tag_descriptions: list[str],
+        field: str,
+        expected: object,
     ):
-        user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
-
-        # Create mock tags
-        mock_tag1 = MagicMock()
-        mock_tag1.description = "Technology"
-        mock_tag2 = MagicMock()
-        mock_tag2.description = "Programming"
-
-        # Create page with tags
+        """Test how a single saved page is rendered by /wikiclip/my."""
         sample_page = WikiClip(
             id=1,
-            title="Tagged Article",
-            content="Article about technology and programming",
-            summary="Article about technology and programming",  # No truncation needed
-            url="https://example.com/tagged",
             created_at=datetime(2024, 1, 1, 12, 0, 0),
-            user_id=user.id,
+            user_id=authenticated_client.user.id,
             related_links=[],
+            **page_fields,
         )
-        # Mock the tags relationship
-        sample_page.tags = [mock_tag1, mock_tag2]
+        sample_page.tags = [
+            Tag(description=description) for description in tag_descriptions
+        ]
 
         mock_repo.count_user_pages.return_value = 1
         mock_repo.get_user_pages.return_value = [sample_page]
 
         # Make request
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
+        response = authenticated_client.get("/wikiclip/my")
 
         # Assertions
         assert response.status_code == 200
-        response_data = response.json()
+        assert orjson.loads(response.content)["data"][0][field] == expected
 
-        page = response_data["data"][0]
-        assert page["tags"] == ["Technology", "Programming"]
-
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
     def test_get_my_pages_repository_error(
-        self, mock_repo_class, authenticated_client: AuthenticatedClientProxy
+        self,
+        mock_repo_class,
+        mock_repo: MagicMock,
+        authenticated_client: AuthenticatedClientProxy,
     ):
-        user = authenticated_client.user
-        mock_repo = AsyncMock(spec=WikiClipRepository)
-        mock_repo_class.return_value = mock_repo
         mock_repo.count_user_pages.side_effect = Exception("Database error")
 
         # Make request
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
+        response = authenticated_client.get("/wikiclip/my")
 
         # Assertions
         assert response.status_code == 500
         assert (
-            "Could not fetch saved pages due to an error" in response.json()["detail"]
+            "Could not fetch saved pages due to an error"
+            in orjson.loads(response.content)["detail"]
         )
 
     # ============================================================================
@@ -1479,18 +1286,13 @@ class TestWikiClipEndpoints:
 
     def test_trending_wikiclip_schema_summary_field_validator(self):
         """Test that TrendingWikiClipSchema summary field_validator is working."""
-        from ehp.core.models.schema.wikiclip import (
-            SUMMARY_MAX_LENGTH,
-            TrendingWikiClipSchema,
-        )
-
         # Test with summary at max length - field_validator should process it
         exact_summary = "A" * SUMMARY_MAX_LENGTH  # Exactly 200 characters
         valid_data = {
             "wikiclip_id": 1,
             "title": "Test Article",
             "summary": exact_summary,
-            "created_at": datetime.now(),
+            "created_at": TEST_DATETIME,
         }
 
         schema = TrendingWikiClipSchema(**valid_data)
@@ -1501,15 +1303,13 @@ class TestWikiClipEndpoints:
 
     def test_trending_wikiclip_schema_summary_short(self):
         """Test TrendingWikiClipSchema summary shorter than SUMMARY_MAX_LENGTH."""
-        from ehp.core.models.schema.wikiclip import TrendingWikiClipSchema
-
         # Test with short summary
         short_summary = "Short summary"
         valid_data = {
             "wikiclip_id": 1,
             "title": "Test Article",
             "summary": short_summary,
-            "created_at": datetime.now(),
+            "created_at": TEST_DATETIME,
         }
 
         schema = TrendingWikiClipSchema(**valid_data)
@@ -1519,7 +1319,6 @@ class TestWikiClipEndpoints:
         assert not schema.summary.endswith("...")
 
 
-@pytest.mark.integration
 class TestWikiClipDocumentEndpoint:
     def test_save_wikiclip_document_fails_for_unsupported_file_type(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
@@ -1538,7 +1337,7 @@ class TestWikiClipDocumentEndpoint:
 
         # Should return 422 for unsupported document type
         assert response.status_code == 422
-        assert "Unsupported document type" in response.json()["detail"]
+        assert "Unsupported document type" in orjson.loads(response.content)["detail"]
 
     def test_save_wikiclip_document_succeeds_with_valid_txt(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
@@ -1625,7 +1424,7 @@ class TestWikiClipDocumentEndpoint:
 
         # Should return 201 Created for successful upload
         assert response.status_code == 201
-        response_body = response.json()
+        response_body = orjson.loads(response.content)
         content = WikiClipResponseSchema.model_construct(
             **response_body
         )  # We want to avoid the input sanitization here
@@ -1638,24 +1437,28 @@ class TestWikiClipDocumentEndpoint:
             == f"fileContents: {expected_content}"
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_json(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
+    @pytest.mark.parametrize(("extension", "format_name"), INVALID_DOCUMENT_FORMATS)
+    def test_save_wikiclip_document_fails_for_invalid_content(
+        self,
+        authenticated_client: AuthenticatedClientProxy,
+        extension: str,
+        format_name: str,
     ):
-        """Test that saving a WikiClip document fails for an invalid .json file."""
-        # Create an invalid .json file (not a valid JSON structure)
-        file = tmp_path / "invalid.json"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid JSON content.")
-
+        """Test that saving a WikiClip document fails when the file does not match its extension."""
         response = authenticated_client.post(
             "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
+            files={
+                "document": (
+                    f"invalid.{extension}",
+                    f"This is not a valid {format_name} content.".encode(),
+                )
+            },
             include_auth=True,
         )
 
-        # Should return 422 for invalid JSON format
+        # Should return 422 for a file that cannot be parsed as its declared format
         assert response.status_code == 422
-        assert "Invalid JSON format" in response.json()["detail"]
+        assert f"Invalid {format_name} format" in orjson.loads(response.content)["detail"]
 
     def test_save_wikiclip_document_succeeds_for_valid_xml(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
@@ -1691,25 +1494,6 @@ class TestWikiClipDocumentEndpoint:
             == "article: \ntitle: Test XML\ncontent: This is a test XML file."
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_xml(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
-    ):
-        """Test that saving a WikiClip document fails for an invalid .xml file."""
-        # Create an invalid .xml file (not well-formed XML)
-        file = tmp_path / "invalid.xml"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid XML content.")
-
-        response = authenticated_client.post(
-            "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
-            include_auth=True,
-        )
-
-        # Should return 422 for invalid XML format
-        assert response.status_code == 422
-        assert "Invalid XML format" in response.json()["detail"]
-
     def test_save_wikiclip_document_succeeds_for_valid_html(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
     ):
@@ -1744,25 +1528,6 @@ class TestWikiClipDocumentEndpoint:
             == "html: \nhead: \ntitle: Test HTML\nbody: \np: This is a test HTML file."
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_html(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
-    ):
-        """Test that saving a WikiClip document fails for an invalid .html file."""
-        # Create an invalid .html file (not well-formed HTML)
-        file = tmp_path / "invalid.html"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid HTML content.")
-
-        response = authenticated_client.post(
-            "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
-            include_auth=True,
-        )
-
-        # Should return 422 for invalid HTML format
-        assert response.status_code == 422
-        assert "Invalid HTML format" in response.json()["detail"]
-
     def test_save_wikiclip_document_succeeds_for_valid_odt(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
     ):
@@ -1790,25 +1555,6 @@ class TestWikiClipDocumentEndpoint:
             == "Example ODT content."
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_odt(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
-    ):
-        """Test that saving a WikiClip document fails for an invalid .odt file."""
-        # Create an invalid .odt file (not a valid ODT structure)
-        file = tmp_path / "invalid.odt"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid ODT content.")
-
-        response = authenticated_client.post(
-            "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
-            include_auth=True,
-        )
-
-        # Should return 422 for invalid ODT format
-        assert response.status_code == 422
-        assert "Invalid ODT format" in response.json()["detail"]
-
     def test_save_wikiclip_document_fails_for_valid_zip_but_invalid_odt(
         self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
     ):
@@ -1826,7 +1572,7 @@ class TestWikiClipDocumentEndpoint:
 
         # Should return 422 for invalid ODT format
         assert response.status_code == 422
-        assert "Invalid ODT format" in response.json()["detail"]
+        assert "Invalid ODT format" in orjson.loads(response.content)["detail"]
 
     def test_save_wikiclip_document_succeeds_for_valid_docx(
         self, authenticated_client: AuthenticatedClientProxy
@@ -1855,25 +1601,6 @@ class TestWikiClipDocumentEndpoint:
             == DOCXExtractor().extract(as_bytesio(file.read_bytes()), file.name).content
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_docx(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
-    ):
-        """Test that saving a WikiClip document fails for an invalid .docx file."""
-        # Create an invalid .docx file (not a valid DOCX structure)
-        file = tmp_path / "invalid.docx"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid DOCX content.")
-
-        response = authenticated_client.post(
-            "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
-            include_auth=True,
-        )
-
-        # Should return 422 for invalid DOCX format
-        assert response.status_code == 422
-        assert "Invalid DOCX format" in response.json()["detail"]
-
     def test_save_wikiclip_document_succeeds_for_valid_pdf(
         self, authenticated_client: AuthenticatedClientProxy
     ):
@@ -1901,57 +1628,47 @@ class TestWikiClipDocumentEndpoint:
             == PDFExtractor().extract(as_bytesio(file.read_bytes()), file.name).content
         )
 
-    def test_save_wikiclip_document_fails_for_invalid_pdf(
-        self, authenticated_client: AuthenticatedClientProxy, tmp_path: Path
-    ):
-        """Test that saving a WikiClip document fails for an invalid .pdf file."""
-        # Create an invalid .pdf file (not a valid PDF structure)
-        file = tmp_path / "invalid.pdf"
-        with open(file, "w") as f:
-            _ = f.write("This is not a valid PDF content.")
-
-        response = authenticated_client.post(
-            "/wikiclip/document",
-            files={"document": (file.name, file.read_bytes())},
-            include_auth=True,
-        )
-
-        # Should return 422 for invalid PDF format
-        assert response.status_code == 422
-        assert "Invalid PDF format" in response.json()["detail"]
-
 
-@pytest.mark.integration
 class TestWikiClipPaginationFields:
     """Integration tests for PagedResponse pagination fields (total_pages, has_next, has_previous)."""
 
+    @pytest.fixture
+    def authenticated_client(
+        self, async_authenticated_client: AsyncAuthenticatedClientProxy
+    ) -> AsyncAuthenticatedClientProxy:
+        """Drive this class through the in-process ``httpx.AsyncClient``."""
+        return async_authenticated_client
+
     @pytest.fixture
     async def user_with_25_wikiclips(
         self,
-        authenticated_client: AuthenticatedClientProxy,
-        test_db_manager: DBManager,
+        authenticated_client: AsyncAuthenticatedClientProxy,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Create 25 wikiclips for the authenticated user for pagination testing."""
         # Use the authenticated client's user to create wikiclips
         user = authenticated_client.user
-        wikiclip_repository = WikiClipRepository(test_db_manager.get_session())
-        
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        contents = [
+            f"This is the content for news article {i}. It contains some sample text for testing pagination."
+            for i in range(1, 26)
+        ]
         # Create 25 wikiclips for the authenticated user
-        wikiclips = []
-        for i in range(1, 26):
-            wikiclip = WikiClip(
+        wikiclips = [
+            WikiClip(
                 id=i + 1000,  # Use higher IDs to avoid conflicts
                 title=f"News {i}",
-                content=f"This is the content for news article {i}. It contains some sample text for testing pagination.",
-                summary=f"This is the content for news article {i}. It contains some sample text for testing pagination."[:100],
+                content=content,
+                summary=content[:100],
                 url=f"https://example.com/news-{i}",
-                created_at=datetime(2024, 1, 1, 12, i % 60, 0),  # Different times for ordering
+                created_at=created_at + timedelta(minutes=i),  # Different times for ordering
                 user_id=user.id,
                 related_links=[],
             )
-            wikiclips.append(wikiclip)
-            await wikiclip_repository.create(wikiclip)
-        
+            for i, content in enumerate(contents, start=1)
+        ]
+        await wikiclip_repo.bulk_create(wikiclips)
+
         return {
             "user": user,
             "wikiclips": wikiclips,
@@ -1961,17 +1678,18 @@ class TestWikiClipPaginationFields:
     async def test_trending_wikiclips_pagination_fields(self, user_with_25_wikiclips):
         """Test pagination fields in trending wikiclips endpoint."""
         client = user_with_25_wikiclips["client"]
-        
+
+        # One request at a time: every request shares the test's AsyncSession
+        first_page, second_page, third_page = [
+            await client.get(f"/wikiclip/trending?page={page}&size=10", include_auth=True)
+            for page in (1, 2, 3)
+        ]
+
         # Test first page (10 items per page)
-        response = client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
+        response = first_page
         assert response.status_code == 200
         
-        data = response.json()
-        
-        # Check pagination fields are present
-        assert "total_pages" in data
-        assert "has_next" in data 
-        assert "has_previous" in data
+        data = orjson.loads(response.content)
         
         # Verify values for first page
         assert data["total_pages"] == 3  # 25 items / 10 per page = 3 pages
@@ -1983,10 +1701,10 @@ class TestWikiClipPaginationFields:
         assert len(data["data"]) == 10
         
         # Test middle page
-        response = client.get("/wikiclip/trending?page=2&size=10", include_auth=True)
+        response = second_page
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["total_pages"] == 3
         assert data["has_next"] is True  # Page 2 of 3 should have next
         assert data["has_previous"] is True  # Page 2 should have previous
@@ -1994,10 +1712,10 @@ class TestWikiClipPaginationFields:
         assert len(data["data"]) == 10
         
         # Test last page
-        response = client.get("/wikiclip/trending?page=3&size=10", include_auth=True)
+        response = third_page
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["total_pages"] == 3
         assert data["has_next"] is False  # Page 3 of 3 should not have next
         assert data["has_previous"] is True  # Page 3 should have previous
@@ -2007,17 +1725,18 @@ class TestWikiClipPaginationFields:
     async def test_search_wikiclips_pagination_fields(self, user_with_25_wikiclips):
         """Test pagination fields in search wikiclips endpoint."""
         client = user_with_25_wikiclips["client"]
-        
+
+        # One request at a time: every request shares the test's AsyncSession
+        first_page, fourth_page = [
+            await client.get(f"/wikiclip/?page={page}&size=7", include_auth=True)
+            for page in (1, 4)
+        ]
+
         # Test with page size of 7 to get different pagination
-        response = client.get("/wikiclip/?page=1&size=7", include_auth=True)
+        response = first_page
         assert response.status_code == 200
         
-        data = response.json()
-        
-        # Check pagination fields are present
-        assert "total_pages" in data
-        assert "has_next" in data
-        assert "has_previous" in data
+        data = orjson.loads(response.content)
         
         # Verify values: 25 items / 7 per page = 4 pages (ceil)
         assert data["total_pages"] == 4  
@@ -2029,10 +1748,10 @@ class TestWikiClipPaginationFields:
         assert len(data["data"]) == 7
         
         # Test last page with partial data
-        response = client.get("/wikiclip/?page=4&size=7", include_auth=True)
+        response = fourth_page
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["total_pages"] == 4
         assert data["has_next"] is False
         assert data["has_previous"] is True
@@ -2042,17 +1761,18 @@ class TestWikiClipPaginationFields:
     async def test_suggested_wikiclips_pagination_fields(self, user_with_25_wikiclips):
         """Test pagination fields in suggested wikiclips endpoint."""
         client = user_with_25_wikiclips["client"]
-        
+
+        # One request at a time: every request shares the test's AsyncSession
+        first_page, second_page = [
+            await client.get(f"/wikiclip/suggested?page={page}&size=15", include_auth=True)
+            for page in (1, 2)
+        ]
+
         # Test with page size of 15
-        response = client.get("/wikiclip/suggested?page=1&size=15", include_auth=True)
+        response = first_page
         assert response.status_code == 200
         
-        data = response.json()
-        
-        # Check pagination fields are present
-        assert "total_pages" in data
-        assert "has_next" in data
-        assert "has_previous" in data
+        data = orjson.loads(response.content)
         
         # Verify values: 25 items / 15 per page = 2 pages
         assert data["total_pages"] == 2
@@ -2064,10 +1784,10 @@ class TestWikiClipPaginationFields:
         assert len(data["data"]) == 15
         
         # Test second page
-        response = client.get("/wikiclip/suggested?page=2&size=15", include_auth=True)
+        response = second_page
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["total_pages"] == 2
         assert data["has_next"] is False
         assert data["has_previous"] is True
@@ -2079,15 +1799,10 @@ class TestWikiClipPaginationFields:
         client = user_with_25_wikiclips["client"]
         
         # Test with page size of 8
-        response = client.get("/wikiclip/my?page=1&size=8", include_auth=True)
+        response = await client.get("/wikiclip/my?page=1&size=8", include_auth=True)
         assert response.status_code == 200
         
-        data = response.json()
-        
-        # Check pagination fields are present
-        assert "total_pages" in data
-        assert "has_next" in data
-        assert "has_previous" in data
+        data = orjson.loads(response.content)
         
         # Verify values: 25 items / 8 per page = 4 pages (ceil)
         assert data["total_pages"] == 4
@@ -2103,10 +1818,10 @@ class TestWikiClipPaginationFields:
         client = user_with_25_wikiclips["client"]
         
         # Request page size larger than total items
-        response = client.get("/wikiclip/trending?page=1&size=30", include_auth=True)
+        response = await client.get("/wikiclip/trending?page=1&size=30", include_auth=True)
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Should be single page with no navigation
         assert data["total_pages"] == 1
@@ -2122,10 +1837,10 @@ class TestWikiClipPaginationFields:
         client = user_with_25_wikiclips["client"]
         
         # Search for non-existent content
-        response = client.get("/wikiclip/?search_term=nonexistent&page=1&size=10", include_auth=True)
+        response = await client.get("/wikiclip/?search_term=nonexistent&page=1&size=10", include_auth=True)
         assert response.status_code == 200
         
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Should handle zero results correctly
         assert data["total_pages"] == 0  # No pages when no results
@@ -2136,7 +1851,7 @@ class TestWikiClipPaginationFields:
         assert data["total_count"] == 0
         assert len(data["data"]) == 0
 
-    async def test_empty_pagination_all_endpoints(self, authenticated_client: AuthenticatedClientProxy):
+    async def test_empty_pagination_all_endpoints(self, authenticated_client: AsyncAuthenticatedClientProxy):
         """Test all wikiclip endpoints return consistent empty paged response when user has no wikiclips."""
         endpoints_with_params = [
             ("/wikiclip/my", {"page": 1, "size": 10}),
@@ -2155,26 +1870,29 @@ class TestWikiClipPaginationFields:
             "has_previous": False,
         }
         
-        for endpoint, params in endpoints_with_params:
-            response = authenticated_client.get(endpoint, params=params, include_auth=True)
-            
+        # One request at a time: every request shares the test's AsyncSession
+        responses = [
+            await authenticated_client.get(endpoint, params=params, include_auth=True)
+            for endpoint, params in endpoints_with_params
+        ]
+        for (endpoint, _), response in zip(endpoints_with_params, responses):
             assert response.status_code == 200, f"Endpoint {endpoint} failed with status {response.status_code}"
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Check all required pagination fields are present and correct for empty response
             for key, expected_value in expected_empty_response.items():
                 assert key in data, f"Missing field '{key}' in response from {endpoint}"
                 assert data[key] == expected_value, f"Field '{key}' in {endpoint} expected {expected_value}, got {data[key]}"
 
-    async def test_get_my_pages_empty_database_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_get_my_pages_empty_database_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, test_db_manager: DBManager):
         """Integration test for get_my_pages with empty database to cover create_empty_paged_response."""
         # This test ensures the actual service code path is covered without mocking
         # The authenticated_client user should have no wikiclips in the clean test database
         
-        response = authenticated_client.get("/wikiclip/my", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/my", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify create_empty_paged_response output
         assert data["data"] == []
@@ -2186,14 +1904,14 @@ class TestWikiClipPaginationFields:
         assert data["has_previous"] is False
         assert data["filters"] is None
 
-    async def test_get_trending_empty_database_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_get_trending_empty_database_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, test_db_manager: DBManager):
         """Integration test for get_trending_wikiclips with empty database to cover create_empty_paged_response."""
         # This test ensures the actual service code path is covered without mocking
         
-        response = authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify create_empty_paged_response output
         assert data["data"] == []
@@ -2205,14 +1923,14 @@ class TestWikiClipPaginationFields:
         assert data["has_previous"] is False
         assert data["filters"] is None
 
-    async def test_search_wikiclips_empty_database_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_search_wikiclips_empty_database_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, test_db_manager: DBManager):
         """Integration test for search_wikiclips with no matching results to cover create_empty_paged_response."""
         # This test ensures the actual service code path is covered without mocking
         
-        response = authenticated_client.get("/wikiclip/?search_term=nonexistentterm&page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/?search_term=nonexistentterm&page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify create_empty_paged_response output
         assert data["data"] == []
@@ -2224,14 +1942,14 @@ class TestWikiClipPaginationFields:
         assert data["has_previous"] is False
         assert data["filters"] is None
 
-    async def test_get_suggested_empty_database_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_get_suggested_empty_database_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, test_db_manager: DBManager):
         """Integration test for get_suggested_wikiclips with empty database to cover create_empty_paged_response."""
         # This test ensures the actual service code path is covered without mocking
         
-        response = authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify create_empty_paged_response output
         assert data["data"] == []
@@ -2244,10 +1962,8 @@ class TestWikiClipPaginationFields:
         # For suggested endpoint, filters should be None for empty results (same as other endpoints)
         assert data["filters"] is None
 
-    async def test_trending_wikiclips_with_data_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_trending_wikiclips_with_data_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, wikiclip_repo: WikiClipRepository):
         """Integration test for get_trending_wikiclips with data to cover success path lines 395-400."""
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        
         # Create test data
         wikiclip = WikiClip(
             id=1,
@@ -2261,10 +1977,10 @@ class TestWikiClipPaginationFields:
         )
         await wikiclip_repo.create(wikiclip)
         
-        response = authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify success path execution - should have data
         assert len(data["data"]) > 0
@@ -2272,10 +1988,8 @@ class TestWikiClipPaginationFields:
         assert data["page"] == 1
         assert data["page_size"] == 10
 
-    async def test_suggested_wikiclips_with_data_integration(self, authenticated_client: AuthenticatedClientProxy, test_db_manager: DBManager):
+    async def test_suggested_wikiclips_with_data_integration(self, authenticated_client: AsyncAuthenticatedClientProxy, wikiclip_repo: WikiClipRepository):
         """Integration test for get_suggested_wikiclips with data to cover success path lines 486-489."""
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        
         # Create test data
         wikiclip = WikiClip(
             id=1,
@@ -2289,10 +2003,10 @@ class TestWikiClipPaginationFields:
         )
         await wikiclip_repo.create(wikiclip)
         
-        response = authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify success path execution - should have data
         assert len(data["data"]) > 0
@@ -2327,63 +2041,42 @@ class TestWikiClipPaginationFields:
         assert result.endswith("...")
         assert result.startswith("A" * 100)
 
-    async def test_save_wikiclip_http_exception_path(self, authenticated_client: AuthenticatedClientProxy):
+    async def test_save_wikiclip_http_exception_path(self, mock_repo_class, mock_repo: MagicMock, authenticated_client: AsyncAuthenticatedClientProxy):
         """Test save_wikiclip HTTP exception handling to cover line 106."""
         # This test creates a scenario that should trigger an HTTPException during save
-        # Using valid data that passes validation but fails at service level
-        
-        valid_data = {
-            "title": "Test Article",
-            "content": "Test content",
-            "url": "https://example.com/test",  # Valid URL format
-            "created_at": datetime.now().isoformat(),
-            "related_links": []
-        }
-        
-        with patch("ehp.core.services.wikiclip.WikiClipRepository") as mock_repo_class:
-            mock_repo = AsyncMock()
-            mock_repo_class.return_value = mock_repo
-            mock_repo.create.side_effect = HTTPException(status_code=400, detail="Bad Request")
-            
-            response = authenticated_client.post("/wikiclip/", json=valid_data, include_auth=True)
-            
-            # Should re-raise the HTTPException (line 106)
-            assert response.status_code == 400
+        # The shared valid body passes validation, so the failure happens in the service
+
+        mock_repo.create.side_effect = HTTPException(status_code=400, detail="Bad Request")
 
-    async def test_save_wikiclip_generic_exception_path(self, authenticated_client: AuthenticatedClientProxy):
+        response = await authenticated_client.post(
+            "/wikiclip/", content=VALID_WIKICLIP_JSON, headers=JSON_HEADERS, include_auth=True
+        )
+
+        # Should re-raise the HTTPException (line 106)
+        assert response.status_code == 400
+
+    async def test_save_wikiclip_generic_exception_path(self, mock_repo_class, mock_repo: MagicMock, authenticated_client: AsyncAuthenticatedClientProxy):
         """Test save_wikiclip generic exception handling to cover lines 109-110."""
-        
-        valid_data = {
-            "title": "Test Article",
-            "content": "Test content", 
-            "url": "https://example.com/test",
-            "created_at": datetime.now().isoformat(),
-            "related_links": []
-        }
-        
-        with patch("ehp.core.services.wikiclip.WikiClipRepository") as mock_repo_class:
-            mock_repo = AsyncMock()
-            mock_repo_class.return_value = mock_repo
-            mock_repo.create.side_effect = Exception("Database connection failed")
-            
-            response = authenticated_client.post("/wikiclip/", json=valid_data, include_auth=True)
-            
-            # Should catch generic exception and return 500 (lines 109-110)
-            assert response.status_code == 500
-            assert response.json()["detail"] == "Internal server error"
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    async def test_trending_wikiclips_empty_response_unit(self, mock_repo_class, authenticated_client: AuthenticatedClientProxy):
+        mock_repo.create.side_effect = Exception("Database connection failed")
+
+        response = await authenticated_client.post(
+            "/wikiclip/", content=VALID_WIKICLIP_JSON, headers=JSON_HEADERS, include_auth=True
+        )
+
+        # Should catch generic exception and return 500 (lines 109-110)
+        assert response.status_code == 500
+        assert orjson.loads(response.content)["detail"] == "Internal server error"
+
+    async def test_trending_wikiclips_empty_response_unit(self, mock_repo_class, mock_repo: MagicMock, authenticated_client: AsyncAuthenticatedClientProxy):
         """Unit test to ensure trending endpoint empty response path is covered (lines 392-393)."""
         # Mock repository to return 0 count
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
         mock_repo.count_trending.return_value = 0  # This will trigger lines 392-393
         
-        response = authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/trending?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify empty response structure (lines 392-393 executed)
         assert data["data"] == []
@@ -2395,18 +2088,15 @@ class TestWikiClipPaginationFields:
         mock_repo.count_trending.assert_called_once()
         mock_repo.get_trending.assert_not_called()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")
-    async def test_search_wikiclips_empty_response_unit(self, mock_repo_class, authenticated_client: AuthenticatedClientProxy):
+    async def test_search_wikiclips_empty_response_unit(self, mock_repo_class, mock_repo: MagicMock, authenticated_client: AsyncAuthenticatedClientProxy):
         """Unit test to ensure search endpoint empty response path is covered (line 441)."""
         # Mock repository to return 0 count
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
         mock_repo.count.return_value = 0  # This will trigger line 441
         
-        response = authenticated_client.get("/wikiclip/?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify empty response structure (line 441 executed)
         assert data["data"] == []
@@ -2418,18 +2108,15 @@ class TestWikiClipPaginationFields:
         mock_repo.count.assert_called_once()
         mock_repo.search.assert_not_called()
 
-    @patch("ehp.core.services.wikiclip.WikiClipRepository")  
-    async def test_suggested_wikiclips_empty_response_unit(self, mock_repo_class, authenticated_client: AuthenticatedClientProxy):
+    async def test_suggested_wikiclips_empty_response_unit(self, mock_repo_class, mock_repo: MagicMock, authenticated_client: AsyncAuthenticatedClientProxy):
         """Unit test to ensure suggested endpoint empty response path is covered (lines 483-484)."""
         # Mock repository to return 0 count
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
         mock_repo.count_suggested.return_value = 0  # This will trigger lines 483-484
         
-        response = authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
+        response = await authenticated_client.get("/wikiclip/suggested?page=1&size=10", include_auth=True)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Verify empty response structure (lines 483-484 executed)
         assert data["data"] == []
@@ -1,16 +1,19 @@
 from datetime import datetime
+import orjson
 import pytest
 
 from ehp.base.session import SessionManager
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.user import User
 from ehp.core.models.db.wikiclip import WikiClip
-from ehp.core.repositories.authentication import AuthenticationRepository
 from ehp.core.repositories.base import BaseRepository
 from ehp.core.repositories.wikiclip import WikiClipRepository
 from ehp.db.db_manager import DBManager
+from ehp.tests.utils.mocks import hashed_test_password
 from ehp.tests.utils.test_client import EHPTestClient
-from ehp.utils.authentication import hash_password
+
+# Fixed so the user and wikiclips are identical in every run
+TEST_DATETIME = datetime(2024, 6, 16, 12, 0, 0)
 
 
 @pytest.mark.integration
@@ -22,7 +25,7 @@ class TestWikiClipEndpointsWithReadingSettings:
             id=100,
             user_name="readingsettingsuser",
             user_email="readingsettings@example.com",
-            user_pwd=hash_password("Te$tPassword123"),
+            user_pwd=hashed_test_password("Te$tPassword123"),
             is_active="1",
             is_confirmed="1",
             retry_count=0,
@@ -30,7 +33,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         self.user = User(
             id=100,
             full_name="Reading Settings User",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             auth_id=self.authentication.id,
         )
 
@@ -42,13 +45,11 @@ class TestWikiClipEndpointsWithReadingSettings:
         test_db_manager: DBManager,
     ):
         """Create authenticated client with user and reading settings."""
-        # Create authentication and user
-        auth_repository = AuthenticationRepository(test_db_manager.get_session())
-        user_repository = BaseRepository(test_db_manager.get_session(), User)
-        
-        await auth_repository.create(self.authentication)
-        await user_repository.create(self.user)
+        # Create authentication and user; both rows go out in a single flush
+        session = test_db_manager.get_session()
         self.authentication.user = self.user
+        session.add_all([self.authentication, self.user])
+        await session.flush()
         
         # Create session token
         session_manager = SessionManager()
@@ -61,7 +62,10 @@ class TestWikiClipEndpointsWithReadingSettings:
         yield test_client
 
     async def test_get_wikiclip_includes_reading_settings(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self,
+        authenticated_client: EHPTestClient,
+        test_db_manager: DBManager,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Test that GET /wikiclip/{id} includes reading settings in response."""
         # Set user reading settings
@@ -76,13 +80,12 @@ class TestWikiClipEndpointsWithReadingSettings:
         await user_repo.update(self.user)
 
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Test Article with Settings",
             content="This article should include reading settings",
             url="https://example.com/test-settings",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=self.user.id,
         )
         await wikiclip_repo.create(test_wikiclip)
@@ -91,7 +94,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         response = authenticated_client.get("/wikiclip/1", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "reading_settings" in response_data
         assert response_data["reading_settings"]["font_size"] == "Large"
         assert response_data["reading_settings"]["color_mode"] == "Dark"
@@ -100,7 +103,10 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert response_data["reading_settings"]["fonts"]["body"] == "Georgia"
 
     async def test_get_my_pages_includes_reading_settings_in_metadata(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self,
+        authenticated_client: EHPTestClient,
+        test_db_manager: DBManager,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Test that GET /wikiclip/my includes reading settings in metadata."""
         # Set user reading settings
@@ -113,23 +119,25 @@ class TestWikiClipEndpointsWithReadingSettings:
         await user_repo.update(self.user)
 
         # Create test wikiclips
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
-        for i in range(3):
-            wikiclip = WikiClip(
-                id=i + 1,
-                title=f"My Article {i + 1}",
-                content=f"Content for article {i + 1}",
-                url=f"https://example.com/article-{i + 1}",
-                created_at=datetime.now(),
-                user_id=self.user.id,
-            )
-            await wikiclip_repo.create(wikiclip)
+        await wikiclip_repo.bulk_create(
+            [
+                WikiClip(
+                    id=i + 1,
+                    title=f"My Article {i + 1}",
+                    content=f"Content for article {i + 1}",
+                    url=f"https://example.com/article-{i + 1}",
+                    created_at=TEST_DATETIME,
+                    user_id=self.user.id,
+                )
+                for i in range(3)
+            ]
+        )
 
         # Test endpoint
         response = authenticated_client.get("/wikiclip/my", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "metadata" in response_data
         assert "reading_settings" in response_data["metadata"]
         metadata_settings = response_data["metadata"]["reading_settings"]
@@ -154,7 +162,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         response = authenticated_client.get("/wikiclip/trending", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "data" in response_data
         assert "metadata" in response_data
         metadata_settings = response_data["metadata"]["reading_settings"]
@@ -182,7 +190,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         )
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "metadata" in response_data
         metadata_settings = response_data["metadata"]["reading_settings"]
         assert metadata_settings["font_size"] == "Small"
@@ -190,7 +198,10 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert metadata_settings["fonts"]["body"] == "Helvetica"
 
     async def test_suggested_wikiclips_includes_reading_settings_in_metadata(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self,
+        authenticated_client: EHPTestClient,
+        test_db_manager: DBManager,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Test that GET /wikiclip/suggested includes reading settings in metadata."""
         # Set user reading settings
@@ -205,13 +216,12 @@ class TestWikiClipEndpointsWithReadingSettings:
         await user_repo.update(self.user)
 
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Suggested Article",
             content="This is a suggested article",
             url="https://example.com/suggested",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=self.user.id,
         )
         await wikiclip_repo.create(test_wikiclip)
@@ -220,7 +230,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         response = authenticated_client.get("/wikiclip/suggested", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "metadata" in response_data
         metadata_settings = response_data["metadata"]["reading_settings"]
         assert metadata_settings["font_size"] == "Medium"
@@ -228,7 +238,10 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert metadata_settings["color_mode"] == "Light"
 
     async def test_user_without_reading_settings_uses_defaults(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self,
+        authenticated_client: EHPTestClient,
+        test_db_manager: DBManager,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Test that user without reading settings gets default values."""
         # Ensure user has no reading settings
@@ -237,13 +250,12 @@ class TestWikiClipEndpointsWithReadingSettings:
         await user_repo.update(self.user)
 
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Default Settings Article",
             content="This article should use default settings",
             url="https://example.com/default-settings",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=self.user.id,
         )
         await wikiclip_repo.create(test_wikiclip)
@@ -252,7 +264,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         response = authenticated_client.get("/wikiclip/1", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         assert "reading_settings" in response_data
         default_settings = response_data["reading_settings"]
         assert default_settings["font_size"] == "Medium"
@@ -260,7 +272,10 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert default_settings["fonts"]["body"] == "System"
 
     async def test_partial_reading_settings_merged_with_defaults(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self,
+        authenticated_client: EHPTestClient,
+        test_db_manager: DBManager,
+        wikiclip_repo: WikiClipRepository,
     ):
         """Test that partial reading settings are merged with defaults."""
         # Set partial reading settings
@@ -273,13 +288,12 @@ class TestWikiClipEndpointsWithReadingSettings:
         await user_repo.update(self.user)
 
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Partial Settings Article",
             content="This article should merge partial settings with defaults",
             url="https://example.com/partial-settings",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=self.user.id,
         )
         await wikiclip_repo.create(test_wikiclip)
@@ -288,7 +302,7 @@ class TestWikiClipEndpointsWithReadingSettings:
         response = authenticated_client.get("/wikiclip/1", include_auth=True)
         assert response.status_code == 200
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         merged_settings = response_data["reading_settings"]
         assert merged_settings["font_size"] == "Large"
         assert merged_settings["color_mode"] == "Dark"
@@ -297,17 +311,16 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert "fonts" in merged_settings
 
     async def test_unauthenticated_request_no_reading_settings(
-        self, test_client: EHPTestClient, test_db_manager: DBManager
+        self, test_client: EHPTestClient, wikiclip_repo: WikiClipRepository
     ):
         """Test that unauthenticated requests don't include reading settings."""
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Public Article",
             content="This is public content",
             url="https://example.com/public",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=100,
         )
         await wikiclip_repo.create(test_wikiclip)
@@ -317,17 +330,16 @@ class TestWikiClipEndpointsWithReadingSettings:
         assert response.status_code in [401, 403]
 
     async def test_wikiclip_content_endpoint_works_without_reading_settings(
-        self, authenticated_client: EHPTestClient, test_db_manager: DBManager
+        self, authenticated_client: EHPTestClient, wikiclip_repo: WikiClipRepository
     ):
         """Test that content endpoint works without reading settings injection."""
         # Create test wikiclip
-        wikiclip_repo = WikiClipRepository(test_db_manager.get_session())
         test_wikiclip = WikiClip(
             id=1,
             title="Test Content Article",
             content="This is the plain text content that should be returned.",
             url="https://example.com/test-content",
-            created_at=datetime.now(),
+            created_at=TEST_DATETIME,
             user_id=self.user.id,
         )
         await wikiclip_repo.create(test_wikiclip)
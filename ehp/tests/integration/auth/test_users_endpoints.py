@@ -26,14 +26,16 @@ class TestUpdatePasswordForResetEndpoint:
         self, test_client: EHPTestClient, setup_jwt, test_db_manager: DBManager
     ):
         profile_repository = BaseRepository(test_db_manager.get_session(), Profile)
-        for profilename, profilecode in constants.PROFILE_IDS.items():
-            _ = await profile_repository.create(
+        _ = await profile_repository.bulk_create(
+            [
                 Profile(
                     id=profilecode,
                     name=profilename,
                     code=profilename.lower(),
                 )
-            )
+                for profilename, profilecode in constants.PROFILE_IDS.items()
+            ]
+        )
 
         authentication = Authentication(
             id=123,
@@ -252,14 +254,16 @@ class TestUpdateUserSettingsEndpoint:
         test_db_manager: DBManager,
     ):
         profile_repository = BaseRepository(test_db_manager.get_session(), Profile)
-        for profilename, profilecode in constants.PROFILE_IDS.items():
-            _ = await profile_repository.create(
+        _ = await profile_repository.bulk_create(
+            [
                 Profile(
                     id=profilecode,
                     name=profilename,
                     code=profilename.lower(),
                 )
-            )
+                for profilename, profilecode in constants.PROFILE_IDS.items()
+            ]
+        )
 
         authentication = Authentication(
             id=123,
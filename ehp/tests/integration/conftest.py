@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 import httpx
@@ -9,14 +10,10 @@ from ehp.base.session import SessionManager
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.profile import Profile
 from ehp.core.models.db.user import User
-from ehp.core.repositories.authentication import AuthenticationRepository
-from ehp.core.repositories.base import BaseRepository
-from ehp.core.repositories.user import UserRepository
 from ehp.db.db_manager import DBManager
+from ehp.tests.utils.mocks import hashed_test_password
 from ehp.tests.utils.test_client import EHPTestClient
 from ehp.utils import constants
-from ehp.utils.authentication import hash_password
-from ehp.utils.date_utils import timezone_now
 
 
 @dataclass
@@ -72,6 +69,8 @@ class AuthenticatedClientProxy:
 
 USER_ID = 123
 AUTH_ID = 123
+# Fixed so the mock user is identical in every test
+USER_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 @pytest.fixture
@@ -84,24 +83,20 @@ async def authenticated_client(
     """
     del setup_jwt  # Used only to invoke the fixture
     session = test_db_manager.get_session()
-    profile_repository = BaseRepository(test_db_manager.get_session(), Profile)
-    for profilename, profilecode in constants.PROFILE_IDS.items():
-        _ = await profile_repository.create(
-            Profile(
-                id=profilecode,
-                name=profilename,
-                code=profilename.lower(),
-            )
+    profiles = [
+        Profile(
+            id=profilecode,
+            name=profilename,
+            code=profilename.lower(),
         )
-
-    auth_repo = AuthenticationRepository(session)
-    user_repo = UserRepository(session)
+        for profilename, profilecode in constants.PROFILE_IDS.items()
+    ]
 
     authentication = Authentication(
         id=AUTH_ID,
         user_name="mockuser",
         user_email="mock@example.com",
-        user_pwd=hash_password("Te$tPassword123"),  # Using hash_password utility
+        user_pwd=hashed_test_password(),
         is_active="1",
         is_confirmed="1",
         retry_count=0,
@@ -109,16 +104,15 @@ async def authenticated_client(
     user = User(
         id=USER_ID,
         full_name="Mock User",
-        created_at=timezone_now(),
+        created_at=USER_CREATED_AT,
         auth_id=authentication.id,
     )
 
-    _ = await auth_repo.create(authentication)
-    _ = await user_repo.create(user)
-
     authentication.user = user
 
-    _ = await auth_repo.update(authentication)
+    # All rows go out in a single flush; the test session is rolled back, so no commit
+    session.add_all([*profiles, authentication, user])
+    await session.flush()
 
     session_manager = SessionManager()
     authentication_payload = session_manager.create_session(
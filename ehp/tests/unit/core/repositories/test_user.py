@@ -9,7 +9,6 @@ from ehp.core.repositories.user import (
     UserNotFoundException,
     InvalidNewsCategoryException,
 )
-from ehp.utils.constants import DISPLAY_NAME_MIN_LENGTH, DISPLAY_NAME_MAX_LENGTH
 
 
 class TestUserRepository:
@@ -506,6 +506,48 @@ class TestWikiClipRepository:
             """Test that repository has the correct model type."""
             assert repository.model == WikiClip
 
+    class TestBulkCreate:
+        """Test the bulk_create method."""
+
+        async def test_bulk_create_adds_all_and_flushes_once(
+            self,
+            repository: WikiClipRepository,
+            mock_session: AsyncMock,
+            sample_wikiclip: WikiClip,
+        ):
+            """Test that bulk_create adds every entity and flushes a single time."""
+            # Arrange
+            other_wikiclip = WikiClip(
+                id=2,
+                title="Other Article",
+                content="Other content",
+                url="https://example.com/other",
+                user_id=123,
+            )
+            wikiclips = [sample_wikiclip, other_wikiclip]
+
+            # Act
+            result = await repository.bulk_create(wikiclips)
+
+            # Assert
+            assert result == wikiclips
+            mock_session.add_all.assert_called_once_with(wikiclips)
+            mock_session.flush.assert_awaited_once_with(wikiclips)
+
+        async def test_bulk_create_reraises_on_exception(
+            self,
+            repository: WikiClipRepository,
+            mock_session: AsyncMock,
+            sample_wikiclip: WikiClip,
+        ):
+            """Test that bulk_create propagates flush errors."""
+            # Arrange
+            mock_session.flush.side_effect = Exception("Database error")
+
+            # Act & Assert
+            with pytest.raises(Exception, match="Database error"):
+                await repository.bulk_create([sample_wikiclip])
+
     class TestGetUserPages:
         """Test the get_user_pages method."""
 
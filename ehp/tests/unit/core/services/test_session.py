@@ -1,7 +1,6 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from fastapi import HTTPException
 
 from ehp.core.models.db.authentication import Authentication
 from ehp.core.models.db.user import User
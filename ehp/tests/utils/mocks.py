@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
@@ -135,16 +136,27 @@ def patch_email():
     return smtp_patch, send_notification_patch
 
 
-def setup_mock_authentication(db_session, user_data=None):
-    """Setup mock authentication data in the database."""
+TEST_PASSWORD = "Te$tPassword123"
+
+
+@cache
+def hashed_test_password(pwd: str = TEST_PASSWORD) -> str:
+    """Hash a test password once per test session.
+    Password hashing is deliberately slow, and the hash is never asserted on,
+    so every fixture can share the same value."""
     from ehp.utils.authentication import hash_password
 
+    return hash_password(pwd)
+
+
+def setup_mock_authentication(db_session, user_data=None):
+    """Setup mock authentication data in the database."""
     if user_data is None:
         user_data = {
             "id": 1,
             "user_name": "testuser",
             "user_email": "test@example.com",
-            "user_pwd": hash_password("Te$tPassword123"),
+            "user_pwd": hashed_test_password(),
             "is_active": "1",
             "is_confirmed": "1",
             "profile_id": 1,
@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 
+import httpx
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -21,24 +22,30 @@ class EHPTestClient:
     def __init__(self, app: FastAPI):
         self.app = app
         self.client = TestClient(app)
-        self.api_key = settings.API_KEY_VALUE
-        self.auth_token = "test-auth-token"
+        self._api_key = settings.API_KEY_VALUE
+        self._auth_token = "test-auth-token"
+        self._build_headers()
 
         # Setup patchers
         self.redis_patch, self.get_redis_patch, self.mock_redis = patch_redis()
         self.es_patch, self.mock_es = patch_elasticsearch()
         self.smtp_patch, self.send_notification_patch = patch_email()
 
-        # Start patches
-        self.redis_patch.start()
-        self.get_redis_patch.start()
-        self.es_patch.start()
-        self.smtp_patch.start()
-        self.send_notification_patch.start()
+        self._start_patches()
 
     def start(self):
         self.client.__enter__()
 
+    def reset(self):
+        """Reset per-test state so one client can be shared between tests."""
+        self.auth_token = "test-auth-token"
+        self.app.dependency_overrides.clear()
+        self.mock_redis.flushall()
+        self.mock_es.data.clear()
+        self.mock_es.index_data.clear()
+        self.mock_smtp.reset_mock()
+        self.mock_send_notification.reset_mock()
+
     def stop(self):
         """Stop the TestClient."""
         self.client.__exit__(None, None, None)
@@ -47,6 +54,14 @@ class EHPTestClient:
         """Clean up by stopping all patches."""
         self._stop_patches()
 
+    def _start_patches(self):
+        """Start all patches."""
+        self.redis_patch.start()
+        self.get_redis_patch.start()
+        self.es_patch.start()
+        self.mock_smtp = self.smtp_patch.start()
+        self.mock_send_notification = self.send_notification_patch.start()
+
     def _stop_patches(self):
         """Stop all active patches."""
         for patcher in [
@@ -62,12 +77,43 @@ class EHPTestClient:
                 # Patch might already be stopped
                 pass
 
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._api_key = value
+        self._build_headers()
+
+    @property
+    def auth_token(self) -> str:
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: str) -> None:
+        self._auth_token = value
+        self._build_headers()
+
+    def _build_headers(self) -> None:
+        """Precompute the request headers.
+        They are rebuilt only when the API key or token changes."""
+        self._headers = {"X-Api-Key": self._api_key}
+        self._auth_headers = {**self._headers, "X-Token-Auth": self._auth_token}
+
     def get_headers(self, include_auth: bool = False) -> Dict[str, str]:
-        """Get headers for API requests."""
-        headers = {"X-Api-Key": self.api_key}
-        if include_auth:
-            headers["X-Token-Auth"] = self.auth_token
-        return headers
+        """Get headers for API requests.
+        Returns a copy, so callers can add headers without touching the cached ones."""
+        return dict(self._auth_headers if include_auth else self._headers)
+
+    def _request_headers(
+        self, include_auth: bool, extra: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Headers for a single request.
+        The cached dict is passed through as is unless the caller adds headers;
+        httpx copies it into its own Headers object, so it is never mutated."""
+        headers = self._auth_headers if include_auth else self._headers
+        return {**headers, **extra} if extra else headers
 
     def get(
         self,
@@ -77,9 +123,7 @@ class EHPTestClient:
         **kwargs
     ) -> Any:
         """Make a GET request to the API."""
-        headers = self.get_headers(include_auth)
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        headers = self._request_headers(include_auth, kwargs.pop("headers", None))
 
         return self.client.get(url, params=params, headers=headers, **kwargs)
 
@@ -91,9 +135,7 @@ class EHPTestClient:
         **kwargs
     ) -> Any:
         """Make a POST request to the API."""
-        headers = self.get_headers(include_auth)
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        headers = self._request_headers(include_auth, kwargs.pop("headers", None))
 
         return self.client.post(url, json=json, headers=headers, **kwargs)
 
@@ -105,9 +147,7 @@ class EHPTestClient:
         **kwargs
     ) -> Any:
         """Make a PUT request to the API."""
-        headers = self.get_headers(include_auth)
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        headers = self._request_headers(include_auth, kwargs.pop("headers", None))
 
         return self.client.put(url, json=json, headers=headers, **kwargs)
 
@@ -119,9 +159,7 @@ class EHPTestClient:
         **kwargs
     ) -> Any:
         """Make a DELETE request to the API."""
-        headers = self.get_headers(include_auth)
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        headers = self._request_headers(include_auth, kwargs.pop("headers", None))
 
         return self.client.delete(url, params=params, headers=headers, **kwargs)
 
@@ -133,13 +171,110 @@ class EHPTestClient:
         return setup_mock_authentication(None, user_data)
 
 
-class AsyncEHPTestClient(EHPTestClient):
+class AsyncEHPTestClient:
     """
     Test client for EHP API that supports async testing with
     appropriate mocking of async dependencies.
+
+    Requests are sent through ``httpx.AsyncClient`` over ``ASGITransport``,
+    so the app runs on the test's event loop instead of the worker thread
+    ``TestClient`` spins up for every request. It wraps an existing
+    ``EHPTestClient``, whose app, mocks and headers it uses on every request.
     """
 
-    async def setup_async_session(self, db_session, mock_data=None):
-        """Setup async session with mock data."""
-        # Implementation would depend on specific test requirements
-        pass
+    def __init__(self, test_client: EHPTestClient):
+        self.test_client = test_client
+        self.async_client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=test_client.app), base_url="http://test"
+        )
+
+    @property
+    def app(self) -> FastAPI:
+        return self.test_client.app
+
+    @property
+    def api_key(self) -> str:
+        return self.test_client.api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self.test_client.api_key = value
+
+    @property
+    def auth_token(self) -> str:
+        return self.test_client.auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: str) -> None:
+        self.test_client.auth_token = value
+
+    def get_headers(self, include_auth: bool = False) -> Dict[str, str]:
+        """Get headers for API requests."""
+        return self.test_client.get_headers(include_auth)
+
+    async def __aenter__(self) -> "AsyncEHPTestClient":
+        await self.async_client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.async_client.__aexit__(*exc_info)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        include_auth: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Make a GET request to the API."""
+        headers = self.test_client._request_headers(
+            include_auth, kwargs.pop("headers", None)
+        )
+
+        return await self.async_client.get(
+            url, params=params, headers=headers, **kwargs
+        )
+
+    async def post(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        include_auth: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Make a POST request to the API."""
+        headers = self.test_client._request_headers(
+            include_auth, kwargs.pop("headers", None)
+        )
+
+        return await self.async_client.post(url, json=json, headers=headers, **kwargs)
+
+    async def put(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        include_auth: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Make a PUT request to the API."""
+        headers = self.test_client._request_headers(
+            include_auth, kwargs.pop("headers", None)
+        )
+
+        return await self.async_client.put(url, json=json, headers=headers, **kwargs)
+
+    async def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        include_auth: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Make a DELETE request to the API."""
+        headers = self.test_client._request_headers(
+            include_auth, kwargs.pop("headers", None)
+        )
+
+        return await self.async_client.delete(
+            url, params=params, headers=headers, **kwargs
+        )
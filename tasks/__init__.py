@@ -91,6 +91,8 @@ def build_pytest_cmd(
     maxfail: Optional[int] = None,
     html: bool = False,
     html_dir: Optional[str] = None,
+    workers: Optional[str] = None,
+    markers: Optional[str] = None,
 ) -> str:
     cmd_parts = ["pytest"]
     if cwd:
@@ -120,6 +122,10 @@ def build_pytest_cmd(
         if html_dir is None:
             html_dir = "htmlcov"
         cmd_parts.append(f"--cov-report html:{html_dir}")
+    if workers:
+        cmd_parts.append(f"-n {workers}")
+    if markers is not None:
+        cmd_parts.append(f"-m '{markers}'")
 
     cmd = " ".join(cmd_parts)
     return cmd
@@ -139,6 +145,8 @@ def build_pytest_cmd(
         "maxfail": "If specified, stop testing after this many failures.",
         "html": "If specified, generate an HTML report in 'htmlcov' directory.",
         "html-dir": "Directory to save the HTML report (default: 'htmlcov').",
+        "workers": "If specified, run tests in parallel with pytest-xdist (e.g. 'auto' or '4').",
+        "markers": "Marker expression selecting the tests to run (default: 'not integration', '' runs all).",
     }
 )
 def pytest(
@@ -155,6 +163,8 @@ def pytest(
     maxfail: Optional[int] = None,
     html: bool = False,
     html_dir: Optional[str] = None,
+    workers: Optional[str] = None,
+    markers: Optional[str] = None,
 ) -> None:
     """Run unit tests using pytest."""
     cmd = build_pytest_cmd(
@@ -170,6 +180,8 @@ def pytest(
         maxfail,
         html,
         html_dir,
+        workers,
+        markers,
     )
     run_command(ctx, cmd, run_in_docker)
 
@@ -233,6 +245,8 @@ def coverage(
     # These are defaults from your existing 'pytest' task's build_pytest_cmd when certain flags are true
     cmd_parts.append("-s")  # Equivalent to no_capture = True (show stdout/stderr)
     cmd_parts.append("--continue-on-collection-errors")  # Useful for larger test suites
+    # Include the integration tests pytest.ini leaves out by default
+    cmd_parts.append("-m ''")
 
     cmd = " ".join(cmd_parts)
 